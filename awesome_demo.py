@@ -6,7 +6,7 @@ Shows off all the amazing features of our proper Streamlit component!
 import streamlit as st
 import time
 import random
-from carbon_button import carbon_button, CarbonIcons
+from briquette import action_job, carbon_button, carbon_button_grid, CarbonIcons
 
 st.set_page_config(
     page_title="Carbon Button Awesomeness", 
@@ -93,11 +93,17 @@ with tab1:
     
     with col2:
         st.markdown("### 🎨 Beautiful SVG Icons")
-        if carbon_button("Upload Magic", CarbonIcons.UPLOAD, key="svg_demo"):
+        # The "upload" runs off the script thread, so the page stays live
+        def upload_magic(seconds):
+            time.sleep(seconds)
+
+        if carbon_button("Upload Magic", CarbonIcons.UPLOAD, key="svg_demo",
+                         action=upload_magic, inputs={"seconds": 0.5}):
             st.session_state.total_clicks += 1
             st.session_state.button_stats["Upload Magic"] = st.session_state.button_stats.get("Upload Magic", 0) + 1
             st.info("🎨 Look at that crisp SVG icon!")
-            time.sleep(0.5)
+        upload = action_job("svg_demo")
+        if upload is not None and upload.status == "done":
             st.success("✨ Rendered perfectly in all browsers!")
     
     with col3:
@@ -190,21 +196,45 @@ with tab3:
     
     st.markdown("### How many buttons can we handle? Let's find out!")
     
-    num_buttons = st.slider("Number of buttons to generate", 10, 100, 50)
+    mode = st.radio(
+        "Rendering",
+        ["Virtualized grid (one iframe)", "Separate buttons (one iframe each)"],
+        horizontal=True,
+    )
     
-    if st.button("🚀 Generate Buttons!", type="primary"):
-        start_time = time.time()
-        
-        cols = st.columns(10)
-        for i in range(num_buttons):
-            with cols[i % 10]:
-                if carbon_button(f"{i+1}", CarbonIcons.ADD, key=f"perf_{i}"):
-                    st.session_state.total_clicks += 1
-                    st.success(f"Button {i+1} clicked!")
+    if mode.startswith("Virtualized"):
+        num_buttons = st.slider("Number of buttons to generate", 100, 20000, 5000, step=100)
         
+        start_time = time.time()
+        clicked = carbon_button_grid(
+            [{"label": f"{i+1}", "icon": CarbonIcons.ADD} for i in range(num_buttons)],
+            key="perf_grid",
+            columns=10,
+            height=480,
+        )
         end_time = time.time()
+        
+        if clicked is not None:
+            st.session_state.total_clicks += 1
+            st.success(f"Button {clicked+1} clicked!")
         st.success(f"✅ Generated {num_buttons} buttons in {end_time - start_time:.2f} seconds!")
-        st.info("Try clicking them - they all work perfectly! No checkbox lag!")
+        st.info("Only the rows you can see are in the DOM - scroll away!")
+    else:
+        num_buttons = st.slider("Number of buttons to generate", 10, 100, 50)
+        
+        if st.button("🚀 Generate Buttons!", type="primary"):
+            start_time = time.time()
+            
+            cols = st.columns(10)
+            for i in range(num_buttons):
+                with cols[i % 10]:
+                    if carbon_button(f"{i+1}", CarbonIcons.ADD, key=f"perf_{i}"):
+                        st.session_state.total_clicks += 1
+                        st.success(f"Button {i+1} clicked!")
+            
+            end_time = time.time()
+            st.success(f"✅ Generated {num_buttons} buttons in {end_time - start_time:.2f} seconds!")
+            st.info("Try clicking them - they all work perfectly! No checkbox lag!")
 
 with tab4:
     st.header("🎨 Design Gallery")
@@ -8,8 +8,21 @@ https://carbondesignsystem.com/
 """
 
 import streamlit.components.v1 as components
+import functools
 import os
 
+from . import action_cache, telemetry
+from ._runtime import current_fragment_id, current_run
+from .actions import EXECUTORS, ActionJob
+from .actions import watch as watch_job
+from .icon_catalogue import IconCatalogue
+from .ledger import ClickLedger
+from .native import render_native_button
+from .styles import inject_carbon_styles, validate_theme
+from .svg import normalize_svg
+from .telemetry import SessionMetrics
+from .theme import Theme, check_mode, resolve_theme, theme_payload
+
 # Check if we're in development mode
 _DEVELOP_MODE = os.getenv("STREAMLIT_CARBON_BUTTON_DEV_MODE", "").lower() == "true"
 
@@ -37,6 +50,21 @@ def carbon_button(
     disabled: bool = False,
     use_container_width: bool = False,
     colors: dict = None,
+    theme: Theme = None,
+    mode: str = "auto",
+    render_mode: str = "auto",
+    throttle_ms: int = 0,
+    coalesce: bool = False,
+    scope: str = "auto",
+    on_click=None,
+    args: tuple = None,
+    kwargs: dict = None,
+    action=None,
+    inputs: dict = None,
+    executor: str = "thread",
+    cache=False,
+    pending_feedback: bool = False,
+    confirm: str = None,
 ) -> bool:
     """
     Create a Carbon Design System button.
@@ -46,9 +74,13 @@ def carbon_button(
     label : str
         The text to display on the button
     icon : str
-        SVG string for the icon (optional)
+        SVG string for the icon (optional). ``CarbonIcons`` members are
+        sent to the frontend by name rather than as markup; other SVG is
+        sanitized and minified once (see ``briquette.svg``).
     key : str
-        An optional key that uniquely identifies this component
+        An optional key that uniquely identifies this component. If
+        omitted, a key is derived from the calling line, label and type,
+        so it stays the same across reruns.
     button_type : str
         The button style - "primary", "secondary", "danger", or "ghost"
     disabled : bool
@@ -56,57 +88,652 @@ def carbon_button(
     use_container_width : bool
         If True, the button will expand to fill its container
     colors : dict
-        Custom colors for the button states. Keys can include:
+        Custom colors for this button's type, in both light and dark
+        mode. Keys can include:
         - rest_bg, rest_text, rest_border
         - hover_bg, hover_text, hover_border
         - active_bg, active_text, active_border
+    theme : Theme
+        Colors for every button type and mode (see ``briquette.theme``).
+        Create it once and reuse it; only the colors that differ from the
+        defaults are sent to the browser. Can't be combined with
+        ``colors``.
+    mode : str
+        Which palette to draw: "auto" (default) follows the light or dark
+        theme of the Streamlit page, "light" or "dark" force one.
+    render_mode : str
+        "component" renders the React component in an iframe. "native"
+        draws a Carbon-styled ``st.button`` with scoped CSS instead,
+        costing no iframe or JavaScript bundle; hover and active states
+        are pure CSS. Requires Streamlit 1.37 or newer. "auto" (default)
+        uses the component until the page has spent its iframe budget
+        (``STREAMLIT_CARBON_BUTTON_IFRAME_BUDGET``, default 50), then
+        switches the remaining buttons to native.
+    throttle_ms : int
+        Minimum time between reruns caused by this button, in
+        milliseconds. Clicks within ``throttle_ms`` of the one that was
+        sent are dropped in the browser, so double clicks and hammering
+        don't queue up reruns. 0 (default) sends every click. Ignored in
+        native mode.
+    coalesce : bool
+        If True, clicks within a ``throttle_ms`` window are counted rather
+        than dropped, and sent together once the window closes. The
+        button then returns the number of clicks in the burst instead of
+        a bool.
+    scope : str
+        What a click reruns. "auto" (default) follows Streamlit: inside
+        an ``st.fragment`` only the fragment reruns, elsewhere the whole
+        app. "fragment" requires the button to be inside a fragment and
+        raises ``ValueError`` otherwise. "app" reruns the whole app even
+        from inside a fragment; the button reports the click in that app
+        run.
+    on_click : callable
+        An optional callback invoked when the button is clicked. As with
+        ``st.button``, it runs at the start of the rerun the click
+        causes, before the script body, so state it changes is already
+        visible to the whole script and no ``st.rerun()`` is needed.
+    args : tuple
+        An optional tuple of args to pass to the callback.
+    kwargs : dict
+        An optional dict of kwargs to pass to the callback.
+    action : callable
+        Work to run when the button is clicked, off the script thread so
+        the page stays responsive. It is called as ``action(**inputs)``
+        and must not use Streamlit commands. The button is busy and
+        disabled until the action finishes, then the app reruns and
+        ``action_job(key)`` holds the result (see ``briquette.actions``).
+    inputs : dict
+        Keyword arguments for ``action``.
+    executor : str
+        Where ``action`` runs: "thread" (default) uses a thread pool
+        shared by all sessions; "process" uses a shared process pool, for
+        CPU-bound work. Process actions must be picklable module-level
+        functions, and a ``ValueError`` is raised on click otherwise.
+    cache : bool or dict
+        If set, a click whose ``inputs`` match an earlier one reuses that
+        result instead of running ``action`` again. True uses a one hour
+        TTL and 128 entries per button; a dict can set ``ttl`` (seconds,
+        None for no expiry) and ``max_entries``. Results are shared by all
+        sessions (see ``briquette.action_cache``).
+    pending_feedback : bool
+        If True, the button shows a spinner and disables itself in the
+        browser as soon as it is clicked, until the rerun that handles the
+        click renders it again. Stops duplicate submissions on slow pages
+        without a server round trip. Ignored in native mode.
+    confirm : str
+        If set, the first click turns the button into a ``confirm``
+        prompt with a Cancel button, inside the browser. The click only
+        reaches Python once the user confirms, so cancelled attempts cost
+        no rerun. The prompt reverts after 5 seconds. Buttons with
+        ``confirm`` always use the component; combining it with
+        ``render_mode="native"`` raises ``ValueError``.
         
     Returns
     -------
-    bool
-        True if the button was clicked, False otherwise
+    bool or int
+        True if the button was clicked, False otherwise. With
+        ``coalesce=True``, the number of clicks since the last run (0 if
+        none).
     """
-    import streamlit as st
-    
-    # Generate a unique key if not provided
+    # Derive a stable key from the call site if not provided. Only the
+    # label and type go into it so toggling disabled/colors/icon doesn't
+    # remount the button
     if key is None:
-        key = f"carbon_button_{id(label)}"
+        key = current_run().auto_key("carbon_button", label, button_type)
+    
+    if render_mode not in ("auto", "component", "native"):
+        raise ValueError(f'render_mode must be "auto", "component" or "native", not {render_mode!r}')
+    if throttle_ms < 0:
+        raise ValueError(f"throttle_ms must be 0 or more, not {throttle_ms!r}")
+    if scope not in ("auto", "fragment", "app"):
+        raise ValueError(f'scope must be "auto", "fragment" or "app", not {scope!r}')
+    if scope == "fragment" and current_fragment_id() is None:
+        raise ValueError('scope="fragment" requires carbon_button to be called inside an st.fragment')
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of {', '.join(EXECUTORS)}, not {executor!r}")
+    cache = action_cache.options(cache)
+    theme = resolve_theme(theme, colors, button_type)
+    check_mode(mode)
+    
+    callback = _click_callback(key, on_click, args, kwargs, action, inputs or {}, executor, cache)
+    busy = False
+    if action is not None:
+        # The click's callback has already started the job by now, so
+        # the button can be drawn busy in the same run
+        jobs = current_run().jobs
+        busy = jobs.is_busy(key)
+        if busy:
+            watch_job(jobs.get(key))
+        elif jobs.at_limit():
+            disabled = True
     
-    # Store the previous click count in session state
-    prev_clicks_key = f"__carbon_button_prev_{key}"
-    if prev_clicks_key not in st.session_state:
-        st.session_state[prev_clicks_key] = 0
+    if confirm:
+        # The confirm step lives in the component, so never go native
+        if render_mode == "native":
+            raise ValueError('confirm is not supported with render_mode="native"')
+        render_mode = "component"
+    
+    if current_run().render_mode(key, render_mode) == "native":
+        # Native buttons have no component value, but still keep their key
+        # (and its action job) alive in the ledger
+        current_run().ledger.touch(key)
+        if icon and _builtin_icon_name(icon) is None:
+            icon = normalize_svg(icon)
+        clicked = render_native_button(
+            label,
+            icon,
+            key,
+            button_type=button_type,
+            disabled=disabled or busy,
+            use_container_width=use_container_width,
+            theme=theme,
+            mode=mode,
+            on_click=callback,
+        )
+        result = int(clicked) if coalesce else clicked
+        return current_run().scoped_click(key, result, scope)
     
     # Call the React component
     component_value = _component_func(
         label=label,
-        icon=icon,
+        **_icon_payload(icon),
         buttonType=button_type,
         disabled=disabled,
+        busy=busy,
         useContainerWidth=use_container_width,
-        colors=colors,
+        themeVars=theme_payload(theme),
+        mode=mode,
+        throttleMs=throttle_ms,
+        coalesce=coalesce,
+        pendingFeedback=pending_feedback,
+        confirm=confirm,
+        ackEvent=_ack_event(key) if pending_feedback or telemetry.ENABLED else None,
+        telemetry=telemetry.ENABLED,
         key=key,
-        default=st.session_state[prev_clicks_key],  # Use previous value as default
+        default=None,
+        on_change=callback,
     )
     
     # Check if there was a new click
-    clicked = False
-    if component_value is not None and component_value > st.session_state[prev_clicks_key]:
-        clicked = True
-        st.session_state[prev_clicks_key] = component_value
-    
-    return clicked
+    clicked = current_run().ledger.consume(key, component_value)
+    # A bundle older than click events sends a bare count instead
+    event = component_value if isinstance(component_value, dict) else {}
+    if clicked and telemetry.ENABLED:
+        current_run().metrics.record(key, event.get("telemetry"))
+    elif telemetry.ENABLED:
+        current_run().metrics.record_report(key, component_value)
+    if coalesce:
+        result = event.get("count", 1) if clicked else 0
+    else:
+        result = clicked
+    return current_run().scoped_click(key, result, scope)
+
+def _ack_event(key):
+    # The click this run answers: the component's current value, which
+    # Streamlit has already updated before the script starts
+    import streamlit as st
+
+    value = st.session_state.get(key)
+    if isinstance(value, dict) and "nonce" in value:
+        return {"nonce": value["nonce"], "seq": value["seq"]}
+    return None
+
+
+def _click_callback(key, on_click, args, kwargs, action, inputs, executor, cache):
+    # Components call on_change without arguments, and only when their
+    # value changes, which for a button means a new click event or a
+    # telemetry report (which _on_click ignores)
+    if on_click is None and action is None:
+        return None
+    return functools.partial(_on_click, key, on_click, args or (), kwargs or {}, action, inputs, executor, cache)
+
+
+def _on_click(key, on_click, args, kwargs, action, inputs, executor, cache):
+    import streamlit as st
+
+    if telemetry.report_id(st.session_state.get(key)) is not None:
+        return
+    if action is not None:
+        current_run().jobs.submit(key, action, inputs, executor, cache)
+    if on_click is not None:
+        on_click(*args, **kwargs)
 
 # Also export the raw function name for backward compatibility
 carbon_button_raw = carbon_button
 
+
+def carbon_button_group(
+    buttons: list,
+    key: str = None,
+    button_type: str = "primary",
+    disabled: bool = False,
+    use_container_width: bool = False,
+    colors: dict = None,
+    theme: Theme = None,
+    mode: str = "auto",
+    vertical: bool = False,
+    gap: str = "0.5rem",
+) -> str:
+    """
+    Create a group of Carbon buttons rendered by a single component.
+
+    Every ``carbon_button`` is its own iframe that loads the whole React
+    bundle. A group draws all of its buttons in one iframe, so a toolbar
+    of N buttons costs one bundle load instead of N.
+
+    Parameters
+    ----------
+    buttons : list of dict
+        One dict per button. Supported keys are ``label``, ``icon``,
+        ``key``, ``button_type``, ``disabled`` and ``help`` (shown as a
+        tooltip). ``key`` identifies the button in the return value and
+        defaults to the button's position in the list.
+    key : str
+        An optional key that uniquely identifies this group
+    button_type : str
+        Default style for buttons that don't set their own ``button_type``
+    disabled : bool
+        If True, every button in the group is disabled
+    use_container_width : bool
+        If True, the buttons share the full width of the container
+    colors : dict
+        Custom colors applied to every button, whatever its type, see
+        ``carbon_button``
+    theme : Theme
+        Colors for every button type and mode, see ``carbon_button``
+    mode : str
+        "auto", "light" or "dark", see ``carbon_button``
+    vertical : bool
+        If True, stack the buttons vertically instead of in a row
+    gap : str
+        CSS gap between buttons
+
+    Returns
+    -------
+    str or None
+        The key of the button clicked in this run, or None
+    """
+    specs = []
+    for index, button in enumerate(buttons):
+        specs.append({
+            "key": str(button.get("key", index)),
+            "label": button.get("label", ""),
+            **_icon_payload(button.get("icon", "")),
+            "buttonType": button.get("button_type", button_type),
+            "disabled": button.get("disabled", False),
+            "help": button.get("help"),
+        })
+
+    # Derive a stable key from the call site and button keys if not provided
+    if key is None:
+        key = current_run().auto_key("carbon_button_group", [spec["key"] for spec in specs])
+
+    current_run().record_iframe(key)
+    component_value = _component_func(
+        variant="group",
+        buttons=specs,
+        buttonType=button_type,
+        disabled=disabled,
+        useContainerWidth=use_container_width,
+        themeVars=theme_payload(resolve_theme(theme, colors)),
+        mode=check_mode(mode),
+        vertical=vertical,
+        gap=gap,
+        key=key,
+        default=None,
+    )
+
+    # Only report a click we haven't seen on a previous run
+    if current_run().ledger.consume(key, component_value):
+        return component_value["key"]
+
+    return None
+
+
+def carbon_button_grid(
+    buttons: list,
+    key: str = None,
+    columns: int = 10,
+    height: int = 400,
+    row_height: int = 48,
+    button_type: str = "secondary",
+    disabled: bool = False,
+    colors: dict = None,
+    theme: Theme = None,
+    mode: str = "auto",
+    gap: str = "0.5rem",
+) -> int:
+    """
+    Create a scrollable, virtualized grid of Carbon buttons.
+
+    The whole grid is one component instance, and the frontend only
+    mounts the rows currently scrolled into view, so grids of many
+    thousands of buttons stay responsive.
+
+    Parameters
+    ----------
+    buttons : list of str or dict
+        One entry per cell. A string is used as the label; a dict may set
+        ``label``, ``icon`` and ``disabled``.
+    key : str
+        An optional key that uniquely identifies this grid
+    columns : int
+        Number of buttons per row
+    height : int
+        Height of the scrollable viewport in pixels
+    row_height : int
+        Height of each row in pixels
+    button_type : str
+        The button style for every cell
+    disabled : bool
+        If True, every cell is disabled
+    colors : dict
+        Custom colors applied to every cell, see ``carbon_button``
+    theme : Theme
+        Colors for every button type and mode, see ``carbon_button``
+    mode : str
+        "auto", "light" or "dark", see ``carbon_button``
+    gap : str
+        CSS gap between cells in a row
+
+    Returns
+    -------
+    int or None
+        Index into ``buttons`` of the cell clicked in this run, or None
+    """
+    # Send cells column-wise, storing each distinct icon only once
+    labels = []
+    icons = []
+    icon_ids = []
+    icon_lookup = {}
+    disabled_cells = []
+    for index, button in enumerate(buttons):
+        if isinstance(button, str):
+            button = {"label": button}
+        labels.append(button.get("label", ""))
+        icon = button.get("icon", "")
+        if icon:
+            if icon not in icon_lookup:
+                icon_lookup[icon] = len(icons)
+                icons.append(_icon_payload(icon))
+            icon_ids.append(icon_lookup[icon])
+        else:
+            icon_ids.append(-1)
+        if button.get("disabled", False):
+            disabled_cells.append(index)
+
+    if key is None:
+        key = current_run().auto_key("carbon_button_grid", columns)
+
+    current_run().record_iframe(key)
+    component_value = _component_func(
+        variant="grid",
+        labels=labels,
+        icons=icons,
+        iconIds=icon_ids if icons else None,
+        disabledCells=disabled_cells,
+        buttonType=button_type,
+        disabled=disabled,
+        themeVars=theme_payload(resolve_theme(theme, colors)),
+        mode=check_mode(mode),
+        columns=columns,
+        height=height,
+        rowHeight=row_height,
+        gap=gap,
+        key=key,
+        default=None,
+    )
+
+    # Only report a click we haven't seen on a previous run
+    if current_run().ledger.consume(key, component_value):
+        return component_value["index"]
+
+    return None
+
+
+def carbon_action_table(
+    data,
+    actions: list,
+    key: str = None,
+    row_id: str = None,
+    columns: list = None,
+    height: int = 400,
+    row_height: int = 48,
+    button_type: str = "ghost",
+    colors: dict = None,
+    theme: Theme = None,
+    mode: str = "auto",
+) -> tuple:
+    """
+    Show a DataFrame with a column of Carbon action buttons on every row.
+
+    The rows travel to the browser through Streamlit's Arrow serialization
+    and the action column is drawn client-side, so a table of N rows with M
+    actions is one component instead of N x M buttons.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The rows to display
+    actions : list
+        The buttons shown on every row. Each entry is a ``CarbonIcons``
+        icon, a ``(name, icon)`` tuple, or a dict with ``name``, ``icon``
+        and optionally ``label`` and ``button_type``. Plain ``CarbonIcons``
+        entries are named after the icon in lower case, e.g. "download".
+    key : str
+        An optional key that uniquely identifies this table
+    row_id : str
+        Column whose value identifies a row in the return value. Defaults
+        to the DataFrame index.
+    columns : list
+        Columns to display. Defaults to all of them.
+    height : int
+        Maximum height of the scrollable rows in pixels
+    row_height : int
+        Height of each row in pixels
+    button_type : str
+        Default style for the action buttons
+    colors : dict
+        Custom colors for the action buttons, whatever their type, see
+        ``carbon_button``
+    theme : Theme
+        Colors for every button type and mode, see ``carbon_button``
+    mode : str
+        "auto", "light" or "dark", see ``carbon_button``
+
+    Returns
+    -------
+    tuple or None
+        ``(row_id, action)`` for the action clicked in this run, or None
+    """
+    specs = []
+    for action in actions:
+        if isinstance(action, dict):
+            spec = dict(action)
+        elif isinstance(action, tuple):
+            spec = {"name": action[0], "icon": action[1]}
+        else:
+            spec = {"name": _icon_name(action), "icon": action}
+        specs.append({
+            "name": spec["name"],
+            **_icon_payload(spec.get("icon", "")),
+            "label": spec.get("label", ""),
+            "buttonType": spec.get("button_type", button_type),
+        })
+
+    if key is None:
+        key = current_run().auto_key("carbon_action_table", [spec["name"] for spec in specs])
+
+    current_run().record_iframe(key)
+    component_value = _component_func(
+        variant="table",
+        data=data[columns] if columns is not None else data,
+        actions=specs,
+        buttonType=button_type,
+        themeVars=theme_payload(resolve_theme(theme, colors)),
+        mode=check_mode(mode),
+        height=min(height, len(data) * row_height),
+        rowHeight=row_height,
+        key=key,
+        default=None,
+    )
+
+    # Only report a click we haven't seen on a previous run
+    if current_run().ledger.consume(key, component_value):
+        row = component_value["row"]
+        if row_id is not None:
+            return data[row_id].iloc[row], component_value["action"]
+        return data.index[row], component_value["action"]
+
+    return None
+
+
+def carbon_color_tuner(
+    palette: dict,
+    key: str = None,
+    debounce_ms: int = 400,
+) -> dict:
+    """
+    Color pickers with a live preview of Carbon buttons, in one component.
+
+    Picking a color restyles the preview straight away in the browser;
+    the palette is only sent back once the user pauses for
+    ``debounce_ms``, so tuning costs one rerun per pause rather than one
+    (or two) per picker change.
+
+    Parameters
+    ----------
+    palette : dict
+        The colors to tune, keyed by ``briquette.styles.THEME_KEYS``
+        (e.g. one mode of ``color_tuner.py``'s scheme). Pass the
+        returned palette back in on the next run; passing a different
+        one (a preset, say) replaces what the user is editing.
+    key : str
+        An optional key that uniquely identifies this tuner
+    debounce_ms : int
+        How long the pickers must be still before the palette is sent,
+        in milliseconds
+
+    Returns
+    -------
+    dict
+        The palette with the user's latest changes, or ``palette`` itself
+        if nothing changed since the last run
+    """
+    validate_theme(palette)
+    if debounce_ms < 0:
+        raise ValueError(f"debounce_ms must be 0 or more, not {debounce_ms!r}")
+
+    if key is None:
+        key = current_run().auto_key("carbon_color_tuner", list(palette))
+
+    current_run().record_iframe(key)
+    component_value = _component_func(
+        variant="tuner",
+        palette=palette,
+        debounceMs=debounce_ms,
+        key=key,
+        default=None,
+    )
+
+    # Only a palette we haven't seen on a previous run replaces the input,
+    # so a preset applied in Python isn't overwritten by a stale value
+    if current_run().ledger.consume(key, component_value):
+        tuned = component_value["palette"]
+        return {name: tuned.get(name, color) for name, color in palette.items()}
+
+    return palette
+
+
+def action_job(key: str) -> ActionJob:
+    """
+    Return the latest ``ActionJob`` started by the button ``key``, or None.
+
+    The job stays available after it finishes until the button is clicked
+    again. Use ``job.status`` ("running", "done" or "failed"),
+    ``job.result()`` and ``job.error`` to report on it.
+    """
+    return current_run().jobs.get(key)
+
+
+def button_metrics() -> SessionMetrics:
+    """
+    Return this session's frontend telemetry.
+
+    Only collected when ``STREAMLIT_CARBON_BUTTON_TELEMETRY`` is "true".
+    ``button_metrics().dump()`` gives, per button key, mount and first
+    paint times, render counts and click-to-acknowledgement latency in
+    milliseconds (see ``briquette.telemetry``). Only ``carbon_button``
+    buttons drawn as components are measured.
+    """
+    return current_run().metrics
+
+
+def click_ledger() -> ClickLedger:
+    """
+    Return this session's click ledger.
+
+    The ledger holds the last click seen for every rendered key and
+    forgets keys that haven't been rendered for
+    ``STREAMLIT_CARBON_BUTTON_LEDGER_RUNS`` page runs (default 5).
+    ``len(click_ledger())`` and ``click_ledger().stats()`` are useful for
+    monitoring long sessions.
+    """
+    return current_run().ledger
+
+
 # Make the function available at package level
-__all__ = ['carbon_button', 'CarbonIcons']
+__all__ = [
+    'carbon_button',
+    'carbon_button_group',
+    'carbon_button_grid',
+    'carbon_action_table',
+    'carbon_color_tuner',
+    'action_job',
+    'click_ledger',
+    'button_metrics',
+    'inject_carbon_styles',
+    'Theme',
+    'CarbonIcons',
+]
+
+
+# The full Carbon icon set, read from disk only when an icon is first used
+_catalogue = IconCatalogue()
+
+
+class _CarbonIconsMeta(type):
+    """Resolve icons that aren't defined on the class from the catalogue."""
+
+    def __getattr__(cls, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            svg = _catalogue.get(name)
+        except OSError:
+            svg = None
+        if svg is None:
+            raise AttributeError(f"CarbonIcons has no icon named {name!r}")
+        return svg
+
+    def __dir__(cls):
+        try:
+            names = _catalogue.names()
+        except OSError:
+            names = []
+        return sorted(set(super().__dir__()) | set(names))
 
 
 # Carbon icon definitions
-class CarbonIcons:
-    """Pre-defined Carbon Design System icons"""
+class CarbonIcons(metaclass=_CarbonIconsMeta):
+    """
+    Pre-defined Carbon Design System icons
+
+    The icons below are always available. Every other Carbon icon, e.g.
+    ``CarbonIcons.CHART_LINE``, is loaded from ``carbon_icons.idx`` on
+    first access and sent as SVG; names the index doesn't have raise
+    AttributeError.
+    """
     
     UPLOAD = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M26 24v4H6v-4H4v4a2 2 0 0 0 2 2h20a2 2 0 0 0 2-2v-4z"/><path d="M6 12l1.41 1.41L15 5.83V24h2V5.83l7.59 7.58L26 12 16 2 6 12z"/></svg>'
     DOWNLOAD = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M26 24v4H6v-4H4v4a2 2 0 0 0 2 2h20a2 2 0 0 0 2-2v-4z"/><path d="M26 14l-1.41-1.41L17 20.17V2h-2v18.17l-7.59-7.58L6 14l10 10l10-10z"/></svg>'
@@ -125,4 +752,47 @@ class CarbonIcons:
     WARNING = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M16 2C8.3 2 2 8.3 2 16s6.3 14 14 14 14-6.3 14-14S23.7 2 16 2zm-1.1 6h2.2v11h-2.2V8zM16 25c-.8 0-1.5-.7-1.5-1.5S15.2 22 16 22s1.5.7 1.5 1.5S16.8 25 16 25z"/></svg>'
     HOME = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M16.612 2.214a1.01 1.01 0 0 0-1.242 0L1 13.419l1.243 1.572L4 13.621V26a2.004 2.004 0 0 0 2 2h20a2.004 2.004 0 0 0 2-2V13.63L29.757 15 31 13.428zM18 26h-4v-8h4zm2 0v-8a2.002 2.002 0 0 0-2-2h-4a2.002 2.002 0 0 0-2 2v8H6V12.062l10-7.79 10 7.8V26z"/></svg>'
     INFO = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M16 2a14 14 0 1 0 14 14A14 14 0 0 0 16 2zm0 26a12 12 0 1 1 12-12 12 12 0 0 1-12 12z"/><path d="M16 11a1.5 1.5 0 1 0 1.5-1.5A1.5 1.5 0 0 0 16 11zm-1.125 3h2.25v9h-2.25z"/></svg>'
-    SUCCESS = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M16 2a14 14 0 1 0 14 14A14 14 0 0 0 16 2zm0 26a12 12 0 1 1 12-12 12 12 0 0 1-12 12z"/><path d="M14 21.5l-5-5.6 1.6-1.4 3.4 3.9 7.4-8.9 1.6 1.3z"/></svg>'
\ No newline at end of file
+    SUCCESS = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M16 2a14 14 0 1 0 14 14A14 14 0 0 0 16 2zm0 26a12 12 0 1 1 12-12 12 12 0 0 1-12 12z"/><path d="M14 21.5l-5-5.6 1.6-1.4 3.4 3.9 7.4-8.9 1.6 1.3z"/></svg>'
+
+
+# Icons in the shipped bundle's sprite. Only these may be sent by name;
+# the bundle draws nothing for any other. The bundle in briquette/frontend
+# predates the sprite, so this stays empty until it is rebuilt from
+# frontend/src, whose CARBON_ICONS (frontend/src/icons.ts) it should list.
+_SPRITE_ICONS = frozenset()
+
+# Built-in icon SVG -> CarbonIcons attribute name, filled on first use
+_icon_refs = {}
+
+
+def _builtin_icon_name(icon: str) -> str:
+    """Return the ``CarbonIcons`` attribute name for a built-in icon, or None."""
+    if not _icon_refs:
+        _icon_refs.update(
+            (value, name) for name, value in vars(CarbonIcons).items() if name.isupper()
+        )
+    return _icon_refs.get(icon)
+
+
+def _icon_payload(icon: str) -> dict:
+    """
+    Component arguments for an icon.
+
+    Icons in the frontend's sprite are sent by name; anything else,
+    including built-ins the sprite doesn't have, is normalized and sent as
+    SVG markup.
+    """
+    if not icon:
+        return {"icon": ""}
+    name = _builtin_icon_name(icon)
+    if name in _SPRITE_ICONS:
+        return {"iconRef": name}
+    return {"icon": normalize_svg(icon)}
+
+
+def _icon_name(icon: str) -> str:
+    """Return the lower-case ``CarbonIcons`` name for an icon SVG."""
+    name = _builtin_icon_name(icon)
+    if name is None:
+        raise ValueError("Icon is not a CarbonIcons member; pass a (name, icon) tuple instead")
+    return name.lower()
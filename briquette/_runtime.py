@@ -0,0 +1,196 @@
+"""
+Per-session bookkeeping across script runs
+
+Streamlit doesn't tell components when a script run starts or ends, so
+the state kept here notices a new run the first time a briquette
+function is called in it. It is stored in ``st.session_state`` and
+tracks how many iframes the page has spent against its budget, and owns
+the session's click ledger and telemetry.
+"""
+
+import hashlib
+import logging
+import os
+import sys
+
+from .actions import SessionJobs
+from .ledger import ClickLedger
+from .telemetry import SessionMetrics
+
+_LOGGER = logging.getLogger("briquette")
+
+_STATE_KEY = "__carbon_button_run"
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Iframe-backed buttons allowed per page before "auto" buttons go native
+IFRAME_BUDGET = int(os.getenv("STREAMLIT_CARBON_BUTTON_IFRAME_BUDGET", "50"))
+
+
+class RunState:
+    """What briquette has rendered during the current script run."""
+
+    def __init__(self):
+        self.run_id = 0
+        self.page_run_id = 0
+        self.fragment_run = False
+        self.iframes = 0
+        self.native = 0
+        self.downgraded = 0
+        self.modes = {}
+        self.auto_keys = {}
+        self.emitted = set()
+        self.ledger = ClickLedger()
+        self.jobs = SessionJobs()
+        self.metrics = SessionMetrics()
+        self._token = None
+
+    def _start_run(self, token, fragment_run: bool):
+        if self.iframes or self.native:
+            self._log_summary()
+        self._token = token
+        self.run_id += 1
+        self.fragment_run = fragment_run
+        self.auto_keys = {}
+        self.emitted = set()
+        if not fragment_run:
+            # A fragment rerun only redraws part of the page, so the page
+            # totals, the modes chosen for it and the ledger's notion of
+            # which keys are still in use carry over
+            self.page_run_id += 1
+            self.ledger.start_page_run(self.page_run_id)
+            # Jobs and telemetry go with the ledger's idle keys, so apps
+            # that generate keys don't grow them without bound either
+            self.jobs.prune(self.ledger)
+            self.metrics.prune(self.ledger)
+            self.iframes = 0
+            self.native = 0
+            self.downgraded = 0
+            self.modes = {}
+
+    def _log_summary(self):
+        level = logging.WARNING if self.downgraded else logging.INFO
+        _LOGGER.log(
+            level,
+            "briquette run %d: %d iframes, %d native buttons (iframe budget %d)",
+            self.run_id,
+            self.iframes,
+            self.native,
+            IFRAME_BUDGET,
+        )
+
+    def render_mode(self, key: str, requested: str) -> str:
+        """Decide how the button ``key`` renders this run and count it."""
+        if requested != "auto":
+            mode = requested
+        elif key in self.modes:
+            # Keep a button's mode stable within a page so it isn't remounted
+            mode = self.modes[key]
+        elif self.iframes < IFRAME_BUDGET:
+            mode = "component"
+        else:
+            mode = "native"
+            self.downgraded += 1
+        self._count(key, mode)
+        return mode
+
+    def _count(self, key: str, mode: str):
+        # Fragment reruns redraw buttons the page totals already include,
+        # so only a key's first appearance in the page counts
+        if key not in self.modes:
+            if mode == "native":
+                self.native += 1
+            else:
+                self.iframes += 1
+        self.modes[key] = mode
+
+    def auto_key(self, prefix: str, *parts) -> str:
+        """
+        Build a key for an unkeyed element from its call site and ``parts``.
+
+        The same line with the same arguments yields the same key on every
+        run, so the element isn't remounted. Repeats within a run (e.g. a
+        loop creating identical buttons) get an ordinal suffix.
+        """
+        frame = sys._getframe(1)
+        while frame is not None and os.path.dirname(os.path.abspath(frame.f_code.co_filename)) == _PACKAGE_DIR:
+            frame = frame.f_back
+        site = (frame.f_code.co_filename, frame.f_lineno) if frame is not None else None
+        digest = hashlib.blake2b(repr((site, parts)).encode("utf-8"), digest_size=8).hexdigest()
+        key = f"{prefix}_{digest}"
+
+        seen = self.auto_keys.get(key, 0)
+        self.auto_keys[key] = seen + 1
+        if seen:
+            key = f"{key}_{seen}"
+        return key
+
+    def first_in_run(self, token: str) -> bool:
+        """True the first time ``token`` is seen this run."""
+        if token in self.emitted:
+            return False
+        self.emitted.add(token)
+        return True
+
+    def record_iframe(self, key: str):
+        """Count the component ``key``, which always renders in its own iframe."""
+        self._count(key, "component")
+
+    def scoped_click(self, key: str, result, scope: str):
+        """
+        Apply a button's rerun ``scope`` to its click ``result``.
+
+        Widgets inside a fragment only rerun that fragment. For
+        ``scope="app"`` a click seen during a fragment run is held in the
+        ledger and the whole app is rerun, where the button reports it.
+        """
+        deferred = self.ledger.take_deferred(key)
+        if deferred is not None:
+            return deferred
+        if result and scope == "app" and self.fragment_run:
+            import streamlit as st
+
+            self.ledger.defer(key, result)
+            st.rerun(scope="app")
+        return result
+
+
+def _run_token(ctx):
+    # ScriptRunContext.reset() installs a fresh cursor dict at the start of
+    # every run (including fragment runs), which makes it a cheap marker
+    return ctx.cursors if ctx is not None else None
+
+
+def current_fragment_id():
+    """Return the id of the ``st.fragment`` the caller is running in, or None."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    if hasattr(ctx, "current_fragment_id"):
+        return ctx.current_fragment_id
+    # Newer Streamlit keeps the fragment in per-thread state
+    try:
+        from streamlit.runtime.scriptrunner_utils.script_run_context import ThreadState
+    except ImportError:
+        return None
+    return ThreadState.get().fragment_id
+
+
+def current_run() -> RunState:
+    """Return this session's ``RunState``, starting a new run if needed."""
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    state = st.session_state.get(_STATE_KEY)
+    if state is None:
+        state = RunState()
+        st.session_state[_STATE_KEY] = state
+
+    token = _run_token(ctx)
+    if token is None or token is not state._token:
+        fragment_run = bool(ctx is not None and getattr(ctx, "fragment_ids_this_run", None))
+        state._start_run(token, fragment_run)
+    return state
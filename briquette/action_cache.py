@@ -0,0 +1,160 @@
+"""
+Memoized button action results
+
+With ``carbon_button(..., action=fn, cache=True)`` a click whose inputs
+match an earlier one returns the stored result instead of running ``fn``
+again. Results are shared by every session in the process, keyed by the
+button key and a hash of the action (its ``__module__`` and
+``__qualname__``), the inputs and the executor. Each button keeps at most
+``max_entries`` results for ``ttl`` seconds, and the whole cache at most
+``STREAMLIT_CARBON_BUTTON_CACHE_ENTRIES``, least recently used first out.
+Expired results are swept out periodically, so buttons that are never
+clicked again don't keep theirs. Failed actions are never stored.
+
+Thread-executor results are shared objects, so treat them as read-only;
+process-executor results are stored pickled and decoded per job.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_ENTRIES = 128
+
+# Results kept across every button in the process
+MAX_ENTRIES = int(os.getenv("STREAMLIT_CARBON_BUTTON_CACHE_ENTRIES", "1024"))
+
+# Seconds between sweeps for expired results
+SWEEP_INTERVAL = 60.0
+
+_entries = OrderedDict()  # (button key, digest) -> (expires, result), oldest first
+_by_key = {}  # button key -> OrderedDict(digest -> None), oldest first
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_next_sweep = 0.0
+
+
+def options(cache) -> tuple:
+    """
+    Normalize a ``cache=`` argument to ``(ttl, max_entries)``, or None.
+
+    ``cache`` is False/None (no caching), True (the defaults) or a dict
+    with optional ``ttl`` (seconds, None for no expiry) and
+    ``max_entries`` keys.
+    """
+    if not cache:
+        return None
+    if cache is True:
+        return DEFAULT_TTL, DEFAULT_MAX_ENTRIES
+    if not isinstance(cache, dict) or set(cache) - {"ttl", "max_entries"}:
+        raise ValueError(f'cache must be True or a dict with "ttl" and/or "max_entries", not {cache!r}')
+    ttl = cache.get("ttl", DEFAULT_TTL)
+    max_entries = cache.get("max_entries", DEFAULT_MAX_ENTRIES)
+    if ttl is not None and ttl <= 0:
+        raise ValueError(f"cache ttl must be positive, not {ttl!r}")
+    if max_entries < 1:
+        raise ValueError(f"cache max_entries must be at least 1, not {max_entries!r}")
+    return ttl, max_entries
+
+
+def _action_id(action):
+    # What identifies an action across reruns, where the function object
+    # itself may be redefined
+    if isinstance(action, functools.partial):
+        return _action_id(action.func), action.args, sorted(action.keywords.items())
+    return (
+        getattr(action, "__module__", None),
+        getattr(action, "__qualname__", type(action).__qualname__),
+    )
+
+
+def inputs_digest(action, inputs: dict, executor: str) -> bytes:
+    """
+    Hash ``action``, its ``inputs`` and ``executor``, independently of keyword order.
+
+    Thread and process jobs store their results differently (the object
+    itself or its pickle), so the executor is part of the key.
+    """
+    try:
+        key = (_action_id(action), sorted(inputs.items()), executor)
+        data = pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        raise ValueError(f"Cached actions need picklable inputs: {e}") from None
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _remove(key: str, digest: bytes):
+    del _entries[key, digest]
+    digests = _by_key[key]
+    del digests[digest]
+    if not digests:
+        del _by_key[key]
+    _stats["evictions"] += 1
+
+
+def _sweep(now: float):
+    # Drop expired results, at most once per SWEEP_INTERVAL
+    global _next_sweep
+    if now < _next_sweep:
+        return
+    _next_sweep = now + SWEEP_INTERVAL
+    expired = [entry for entry, (expires, _) in _entries.items() if expires is not None and expires <= now]
+    for key, digest in expired:
+        _remove(key, digest)
+
+
+def get(key: str, digest: bytes):
+    """Return ``(True, result)`` for a live entry, else ``(False, None)``."""
+    now = time.monotonic()
+    with _lock:
+        _sweep(now)
+        entry = _entries.get((key, digest))
+        if entry is None:
+            _stats["misses"] += 1
+            return False, None
+        expires, result = entry
+        if expires is not None and expires <= now:
+            _remove(key, digest)
+            _stats["misses"] += 1
+            return False, None
+        _entries.move_to_end((key, digest))
+        _by_key[key].move_to_end(digest)
+        _stats["hits"] += 1
+        return True, result
+
+
+def put(key: str, digest: bytes, result, ttl, max_entries: int):
+    """Store ``result``, evicting the least recently used entries over either bound."""
+    now = time.monotonic()
+    expires = now + ttl if ttl is not None else None
+    with _lock:
+        _sweep(now)
+        _entries[key, digest] = (expires, result)
+        _entries.move_to_end((key, digest))
+        digests = _by_key.setdefault(key, OrderedDict())
+        digests[digest] = None
+        digests.move_to_end(digest)
+        while len(digests) > max_entries:
+            _remove(key, next(iter(digests)))
+        while len(_entries) > MAX_ENTRIES:
+            _remove(*next(iter(_entries)))
+
+
+def stats() -> dict:
+    """Hit, miss and eviction counts and the number of stored results."""
+    with _lock:
+        return dict(_stats, size=len(_entries), buttons=len(_by_key))
+
+
+def clear_cache():
+    """Forget every stored result and reset the counters."""
+    with _lock:
+        _entries.clear()
+        _by_key.clear()
+        for name in _stats:
+            _stats[name] = 0
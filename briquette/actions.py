@@ -0,0 +1,276 @@
+"""
+Button actions that run off the script thread
+
+``carbon_button(..., action=fn)`` hands ``fn`` to a worker pool instead of
+running it inside the script, so a slow action doesn't freeze the page.
+While the job runs the button is drawn busy and disabled, and a small
+polling fragment reruns the app once the job finishes, when
+``action_job(key)`` returns its result.
+
+The pool is shared by every session in the process and bounded by
+``STREAMLIT_CARBON_BUTTON_ACTION_WORKERS``; each session may only have
+``STREAMLIT_CARBON_BUTTON_SESSION_JOBS`` jobs running at once. Actions run
+without a script context, so they must not call Streamlit commands.
+
+CPU-bound actions should use ``executor="process"``, which runs them in a
+shared process pool so they don't hold the GIL the server's sessions all
+share. The action and its inputs are pickled, so the action must be a
+module-level function importable by the worker (not a lambda or a
+function defined in the Streamlit script). Workers are started with the
+``forkserver`` method (``spawn`` where that isn't available), never by
+forking the server. Results larger than
+``STREAMLIT_CARBON_BUTTON_MAX_RESULT_BYTES`` pickled are refused in the
+worker. Queued jobs whose session has disconnected are cancelled before
+they start: the queue is checked whenever a process job is submitted or
+finishes, and on every poll of a session waiting for a job.
+"""
+
+import functools
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+from . import action_cache
+
+_LOGGER = logging.getLogger("briquette")
+
+# Worker threads shared by every session in the process
+ACTION_WORKERS = int(os.getenv("STREAMLIT_CARBON_BUTTON_ACTION_WORKERS", "4"))
+
+# Jobs a single session may have running at the same time
+SESSION_JOBS = int(os.getenv("STREAMLIT_CARBON_BUTTON_SESSION_JOBS", "2"))
+
+# Seconds between checks for a finished job
+POLL_INTERVAL = float(os.getenv("STREAMLIT_CARBON_BUTTON_ACTION_POLL", "0.5"))
+
+# Worker processes for executor="process"
+PROCESS_WORKERS = int(os.getenv("STREAMLIT_CARBON_BUTTON_PROCESS_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Largest pickled result a process job may send back
+MAX_RESULT_BYTES = int(os.getenv("STREAMLIT_CARBON_BUTTON_MAX_RESULT_BYTES", str(32 * 1024 * 1024)))
+
+EXECUTORS = ("thread", "process")
+
+_pool = None
+_process_pool = None
+_pool_lock = threading.Lock()
+
+# Process jobs not yet finished, with the session that started them
+_process_jobs = {}
+
+_UNSET = object()
+
+
+def _thread_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=ACTION_WORKERS, thread_name_prefix="briquette-action")
+        return _pool
+
+
+def _processes() -> ProcessPoolExecutor:
+    global _process_pool
+    with _pool_lock:
+        if _process_pool is None:
+            # Forking the threaded Streamlit server can copy held locks into
+            # the child, so start workers from a clean interpreter instead
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _process_pool = ProcessPoolExecutor(
+                max_workers=PROCESS_WORKERS, mp_context=multiprocessing.get_context(method)
+            )
+        return _process_pool
+
+
+class ResultTooLarge(ValueError):
+    """A process job's result was bigger than ``MAX_RESULT_BYTES``."""
+
+
+def _run_pickled(action, inputs: dict, max_bytes: int) -> bytes:
+    # Runs in the worker process. Checking the size here means an
+    # oversized result is never copied back to the server process
+    data = pickle.dumps(action(**inputs), protocol=pickle.HIGHEST_PROTOCOL)
+    if len(data) > max_bytes:
+        raise ResultTooLarge(f"Action result is {len(data)} bytes pickled, the limit is {max_bytes}")
+    return data
+
+
+def _session_id():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+def _cancel_orphaned_jobs():
+    """Cancel queued process jobs whose session has disconnected."""
+    from streamlit.runtime import Runtime
+
+    with _pool_lock:
+        jobs = list(_process_jobs.items())
+    if not jobs or not Runtime.exists():
+        return
+    runtime = Runtime.instance()
+    for future, session_id in jobs:
+        if session_id is not None and not runtime.is_active_session(session_id):
+            future.cancel()
+
+
+def _submit_process(action, inputs: dict):
+    try:
+        pickle.dumps((action, inputs))
+    except Exception as e:
+        raise ValueError(
+            f'executor="process" needs a picklable action and inputs (a module-level function, '
+            f"not a lambda or a function defined in the script): {e}"
+        ) from None
+    _cancel_orphaned_jobs()
+    future = _processes().submit(_run_pickled, action, inputs, MAX_RESULT_BYTES)
+    with _pool_lock:
+        _process_jobs[future] = _session_id()
+    future.add_done_callback(_forget_process_job)
+    return future
+
+
+def _forget_process_job(future):
+    with _pool_lock:
+        _process_jobs.pop(future, None)
+    # A worker is about to take the next queued job; don't let it be one
+    # nobody is waiting for
+    _cancel_orphaned_jobs()
+
+
+class ActionJob:
+    """One run of a button's action."""
+
+    def __init__(self, key: str, future, pickled: bool = False):
+        self.key = key
+        self.started = time.monotonic()
+        self.finished = None
+        self._future = future
+        self._pickled = pickled
+        self._decoded = _UNSET
+        # True when the result came from the action cache
+        self.cached = False
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        self.finished = time.monotonic()
+
+    @property
+    def done(self) -> bool:
+        """True once the action has returned or raised."""
+        return self._future.done()
+
+    @property
+    def status(self) -> str:
+        """"running", "done", "failed" or "cancelled"."""
+        if not self._future.done():
+            return "running"
+        if self._future.cancelled():
+            return "cancelled"
+        return "failed" if self._future.exception() is not None else "done"
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds the job has been running, or took to run."""
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def error(self):
+        """The exception the action raised, or None."""
+        if not self._future.done() or self._future.cancelled():
+            return None
+        return self._future.exception()
+
+    def result(self):
+        """Return the action's result, re-raising its exception if it failed."""
+        result = self._future.result()
+        if self._pickled:
+            # Process jobs send their result back pickled; decode it once
+            if self._decoded is _UNSET:
+                self._decoded = pickle.loads(result)
+            return self._decoded
+        return result
+
+
+class SessionJobs:
+    """The jobs a session has started, by button key."""
+
+    def __init__(self):
+        self._jobs = {}
+
+    def get(self, key: str):
+        return self._jobs.get(key)
+
+    def running(self) -> int:
+        return sum(1 for job in self._jobs.values() if not job.done)
+
+    def is_busy(self, key: str) -> bool:
+        job = self._jobs.get(key)
+        return job is not None and not job.done
+
+    def at_limit(self) -> bool:
+        return self.running() >= SESSION_JOBS
+
+    def prune(self, live):
+        """Forget finished jobs whose key isn't in ``live`` (the click ledger)."""
+        for key in [key for key, job in self._jobs.items() if job.done and key not in live]:
+            del self._jobs[key]
+
+    def submit(self, key: str, action, inputs: dict, executor: str, cache=None):
+        """
+        Start ``action(**inputs)`` for ``key``, or return None at the limit.
+
+        ``cache`` is ``(ttl, max_entries)`` from ``action_cache.options``;
+        a stored result for the same inputs gives an already finished job.
+        """
+        if self.is_busy(key):
+            return None
+        pickled = executor == "process"
+        if cache is not None:
+            digest = action_cache.inputs_digest(action, inputs, executor)
+            hit, result = action_cache.get(key, digest)
+            if hit:
+                future = Future()
+                future.set_result(result)
+                job = self._jobs[key] = ActionJob(key, future, pickled=pickled)
+                job.cached = True
+                return job
+        if self.at_limit():
+            _LOGGER.warning(
+                "briquette: not starting action for %r, session already has %d running",
+                key,
+                SESSION_JOBS,
+            )
+            return None
+        if pickled:
+            future = _submit_process(action, inputs)
+        else:
+            future = _thread_pool().submit(action, **inputs)
+        if cache is not None:
+            future.add_done_callback(functools.partial(_store_result, key, digest, cache))
+        job = self._jobs[key] = ActionJob(key, future, pickled=pickled)
+        return job
+
+
+def _store_result(key: str, digest: bytes, cache: tuple, future):
+    if not future.cancelled() and future.exception() is None:
+        action_cache.put(key, digest, future.result(), *cache)
+
+
+def watch(job: ActionJob):
+    """Rerun the app once ``job`` finishes, polling from a fragment."""
+    import streamlit as st
+
+    @st.fragment(run_every=POLL_INTERVAL)
+    def _carbon_action_watcher():
+        if job.done:
+            st.rerun(scope="app")
+        _cancel_orphaned_jobs()
+
+    _carbon_action_watcher()
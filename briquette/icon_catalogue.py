@@ -0,0 +1,158 @@
+"""
+Lazily-loaded Carbon icon catalogue
+
+The full Carbon icon set is over 2,500 icons, far too many to keep as
+string literals in the package. Instead they live in a single index file,
+``carbon_icons.idx``, laid out as::
+
+    b"BQICONS1"                      magic
+    uint32 (big endian)              length of the compressed header
+    zlib(JSON {name: [offset, size]}) header
+    zlib(svg) zlib(svg) ...          one compressed blob per icon
+
+The file is memory-mapped on first use, the header is decoded once, and
+each icon is decompressed only the first time it is requested. Importing
+``briquette`` therefore costs the same however many icons exist.
+
+Set ``STREAMLIT_CARBON_BUTTON_ICON_INDEX`` to read a different index. To
+build one from the SVGs in the ``@carbon/icons`` npm package::
+
+    python -m briquette.icon_catalogue node_modules/@carbon/icons/svg/32 carbon_icons.idx
+
+Icons in subdirectories (e.g. ``watson-health``) are prefixed with the
+directory name. The output defaults to ``carbon_icons.idx`` in the
+current directory; copy it over ``briquette/carbon_icons.idx`` to ship it.
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+
+MAGIC = b"BQICONS1"
+_HEADER = struct.Struct(">I")
+
+CATALOGUE_PATH = os.getenv(
+    "STREAMLIT_CARBON_BUTTON_ICON_INDEX",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "carbon_icons.idx"),
+)
+
+
+def icon_name(filename: str) -> str:
+    """
+    Turn a Carbon SVG path such as ``chart--bar.svg`` into ``CHART_BAR``.
+
+    ``filename`` is relative to the SVG directory, so
+    ``watson-health/3d-cursor.svg`` becomes ``WATSON_HEALTH_3D_CURSOR``.
+    """
+    stem = os.path.splitext(filename)[0]
+    return re.sub(r"[^A-Z0-9]+", "_", stem.upper()).strip("_")
+
+
+class IconCatalogue:
+    """Read-only view of an icon index file with memoized lookups."""
+
+    def __init__(self, path: str = CATALOGUE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mmap = None
+        self._index = None
+        self._data_start = 0
+        self._decoded = {}
+
+    def _load(self):
+        with self._lock:
+            if self._index is not None:
+                return
+            with open(self.path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if buffer[:len(MAGIC)] != MAGIC:
+                buffer.close()
+                raise ValueError(f"{self.path} is not a Carbon icon index")
+            header_start = len(MAGIC) + _HEADER.size
+            (header_size,) = _HEADER.unpack_from(buffer, len(MAGIC))
+            header = buffer[header_start:header_start + header_size]
+            self._data_start = header_start + header_size
+            self._mmap = buffer
+            self._index = json.loads(zlib.decompress(header))
+
+    def names(self) -> list:
+        """Names of every icon in the catalogue."""
+        if self._index is None:
+            self._load()
+        return sorted(self._index)
+
+    def get(self, name: str) -> str:
+        """Return the SVG markup for ``name``, or None if it isn't in the catalogue."""
+        svg = self._decoded.get(name)
+        if svg is not None:
+            return svg
+        if self._index is None:
+            self._load()
+        entry = self._index.get(name)
+        if entry is None:
+            return None
+        offset, size = entry
+        start = self._data_start + offset
+        svg = zlib.decompress(self._mmap[start:start + size]).decode("utf-8")
+        self._decoded[name] = svg
+        return svg
+
+    def __contains__(self, name: str) -> bool:
+        if self._index is None:
+            self._load()
+        return name in self._index
+
+    def __len__(self) -> int:
+        if self._index is None:
+            self._load()
+        return len(self._index)
+
+
+def build_catalogue(icons: dict, path: str):
+    """Write ``icons`` (name -> SVG markup) to an index file at ``path``."""
+    index = {}
+    blobs = []
+    offset = 0
+    for name in sorted(icons):
+        blob = zlib.compress(icons[name].encode("utf-8"), 9)
+        index[name] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+    header = zlib.compress(json.dumps(index, separators=(",", ":")).encode("utf-8"), 9)
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER.pack(len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+
+
+def build_catalogue_from_directory(svg_dir: str, path: str):
+    """Index every ``*.svg`` file under ``svg_dir``, named after its path."""
+    icons = {}
+    for root, dirs, files in os.walk(svg_dir):
+        dirs.sort()
+        for filename in sorted(files):
+            if filename.endswith(".svg"):
+                name = icon_name(os.path.relpath(os.path.join(root, filename), svg_dir))
+                if name in icons:
+                    raise ValueError(f"Two SVG files under {svg_dir} map to the icon name {name!r}")
+                with open(os.path.join(root, filename), encoding="utf-8") as f:
+                    icons[name] = re.sub(r">\s+<", "><", " ".join(f.read().split()))
+    build_catalogue(icons, path)
+    return len(icons)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python -m briquette.icon_catalogue SVG_DIR [OUTPUT]")
+        sys.exit(1)
+    svg_dir, output = sys.argv[1], sys.argv[2] if len(sys.argv) == 3 else "carbon_icons.idx"
+    count = build_catalogue_from_directory(svg_dir, output)
+    print(f"Indexed {count} icons into {output}")
@@ -0,0 +1,98 @@
+"""
+Click ledger
+
+A component's value stays the same across reruns until the next click,
+so briquette has to remember the last click it acted on for every key.
+Each click arrives as an event carrying the mount's random ``nonce`` and
+a ``seq`` number, so a remounted iframe (which starts numbering again)
+never looks like an old click. Rather than one ``st.session_state`` entry
+per key, which apps with generated keys grow without bound, each session
+has a single ledger that forgets keys that haven't been rendered for a
+few page runs.
+"""
+
+import os
+
+# Page runs a key may go unrendered before the ledger forgets it
+IDLE_RUNS = int(os.getenv("STREAMLIT_CARBON_BUTTON_LEDGER_RUNS", "5"))
+
+
+class ClickLedger:
+    """Last click value seen per key, with idle keys evicted."""
+
+    def __init__(self, idle_runs: int = IDLE_RUNS):
+        self.idle_runs = idle_runs
+        self.evicted = 0
+        self._page_run = 0
+        # key -> [last event id, page run the key was last rendered in]
+        self._entries = {}
+        # key -> click result held over for the next run (see ``defer``)
+        self._deferred = {}
+
+    def consume(self, key: str, value) -> bool:
+        """
+        Record that ``key`` was rendered with component value ``value``.
+
+        Returns True if ``value`` is a click event the app hasn't acted on
+        yet. ``value`` is the dict the frontend sent (or None before the
+        first click); only its ``nonce`` and ``seq`` are looked at. The
+        running click count a bundle older than click events sends is
+        accepted too; anything else is treated like no click at all.
+        """
+        event = _event_id(value)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = [event, self._page_run]
+            # A key the ledger doesn't know yet can't have a stale value:
+            # Streamlit drops component state along with the widget
+            return event is not None
+        entry[1] = self._page_run
+        if event is None or event == entry[0]:
+            return False
+        entry[0] = event
+        return True
+
+    def touch(self, key: str):
+        """Record that ``key`` was rendered without a component value (native mode)."""
+        self.consume(key, None)
+
+    def defer(self, key: str, result):
+        """Hold a consumed click's ``result`` until ``take_deferred`` asks for it."""
+        self._deferred[key] = result
+
+    def take_deferred(self, key: str):
+        """Return and forget the click held over for ``key``, or None."""
+        return self._deferred.pop(key, None)
+
+    def start_page_run(self, page_run: int):
+        """Evict keys not rendered in the last ``idle_runs`` page runs."""
+        self._page_run = page_run
+        oldest = page_run - self.idle_runs
+        stale = [key for key, (_, last_run) in self._entries.items() if last_run < oldest]
+        for key in stale:
+            del self._entries[key]
+            self._deferred.pop(key, None)
+        self.evicted += len(stale)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def stats(self) -> dict:
+        """Size and eviction counts, for monitoring."""
+        return {"size": len(self._entries), "evicted": self.evicted, "idle_runs": self.idle_runs}
+
+
+def _event_id(value):
+    """``(nonce, seq)`` of a click event value, or None if it isn't one."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        # Bundles older than click events count clicks per mount instead
+        return (None, value) if value > 0 else None
+    if not isinstance(value, dict):
+        return None
+    nonce, seq = value.get("nonce"), value.get("seq")
+    if nonce is None or seq is None:
+        return None
+    return nonce, seq
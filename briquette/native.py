@@ -0,0 +1,129 @@
+"""
+Native render mode: Carbon buttons without an iframe
+
+Draws the button with ``st.button`` and styles it with CSS scoped to the
+``st-key-<key>`` class Streamlit puts on keyed widgets. The icon is an SVG
+data URI used as a CSS mask, so it still follows the text color. No
+component iframe is created and no JavaScript bundle is loaded.
+
+Requires a Streamlit version that adds ``st-key-*`` classes (1.37+).
+"""
+
+import re
+from functools import lru_cache
+from urllib.parse import quote
+
+from .theme import DEFAULT_THEME, Theme
+
+def key_class(key: str) -> str:
+    """The CSS class Streamlit gives the container of a widget with ``key``."""
+    return "st-key-" + re.sub(r"[^a-zA-Z0-9_-]", "-", key.strip())
+
+
+def _rules(selector: str, colors: dict, button_type: str) -> str:
+    border = "1px solid" if button_type in ("secondary", "ghost") else "0 solid"
+    shadow = "0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.05)" if button_type == "secondary" else "none"
+    return (
+        f"{selector} button {{"
+        f"background-color: {colors['rest_bg']} !important;"
+        f"color: {colors['rest_text']} !important;"
+        f"border: {border} {colors['rest_border']} !important;"
+        f"border-radius: 0 !important;"
+        f"box-shadow: {shadow} !important;"
+        f"font-family: \"IBM Plex Sans\", system-ui, -apple-system, sans-serif !important;"
+        f"transition: all 70ms cubic-bezier(0.2, 0, 0.38, 0.9) !important;"
+        f"}}"
+        f"{selector} button:hover:enabled {{"
+        f"background-color: {colors['hover_bg']} !important;"
+        f"color: {colors['hover_text']} !important;"
+        f"border-color: {colors['hover_border']} !important;"
+        f"transform: translateY(-1px);"
+        f"box-shadow: 0 2px 6px rgba(0, 0, 0, 0.15) !important;"
+        f"}}"
+        f"{selector} button:active:enabled {{"
+        f"background-color: {colors['active_bg']} !important;"
+        f"color: {colors['active_text']} !important;"
+        f"border-color: {colors['active_border']} !important;"
+        f"transform: translateY(0);"
+        f"box-shadow: inset 0 1px 2px rgba(0, 0, 0, 0.2) !important;"
+        f"}}"
+        f"{selector} button:disabled {{opacity: 0.5; cursor: not-allowed;}}"
+    )
+
+
+def _icon_rules(selector: str, icon: str) -> str:
+    if "xmlns=" not in icon:
+        icon = icon.replace("<svg", '<svg xmlns="http://www.w3.org/2000/svg"', 1)
+    uri = "data:image/svg+xml," + quote(icon)
+    return (
+        f"{selector} button {{gap: 0.5rem;}}"
+        f"{selector} button::before {{"
+        f"content: \"\"; width: 16px; height: 16px; flex-shrink: 0;"
+        f"background-color: currentColor;"
+        f"-webkit-mask: url(\"{uri}\") center / contain no-repeat;"
+        f"mask: url(\"{uri}\") center / contain no-repeat;"
+        f"}}"
+    )
+
+
+def _page_mode(mode: str):
+    """The mode to draw in, or None to leave it to the browser."""
+    if mode != "auto":
+        return mode
+    import streamlit as st
+
+    # st.context.theme (Streamlit 1.46+) knows the page's actual theme,
+    # which may differ from the OS setting
+    theme = getattr(getattr(st, "context", None), "theme", None)
+    page_mode = getattr(theme, "type", None)
+    return page_mode if page_mode in ("light", "dark") else None
+
+
+# Stands in for the button's key class in cached stylesheets
+_SELECTOR = ".st-key-BRIQUETTE-SELECTOR"
+
+
+@lru_cache(maxsize=256)
+def _template(button_type: str, theme: Theme, icon: str, mode: str = None) -> str:
+    # Everything but the key, so every button of one style shares an entry
+    if mode is not None:
+        css = _rules(_SELECTOR, theme.palette(mode, button_type), button_type)
+    else:
+        sheets = [_rules(_SELECTOR, theme.palette(mode, button_type), button_type) for mode in ("light", "dark")]
+        css = sheets[0] + "@media (prefers-color-scheme: dark) {" + sheets[1] + "}"
+    if icon:
+        css += _icon_rules(_SELECTOR, icon)
+    return f"<style>{css}</style>"
+
+
+def _stylesheet(key: str, button_type: str, theme: Theme, icon: str, mode: str = None) -> str:
+    return _template(button_type, theme, icon, mode).replace(_SELECTOR, "." + key_class(key))
+
+
+def render_native_button(
+    label: str,
+    icon: str,
+    key: str,
+    button_type: str = "primary",
+    disabled: bool = False,
+    use_container_width: bool = False,
+    theme: Theme = None,
+    mode: str = "auto",
+    on_click=None,
+    args: tuple = None,
+    kwargs: dict = None,
+) -> bool:
+    """Draw a Carbon-styled ``st.button`` and return whether it was clicked."""
+    import streamlit as st
+
+    stylesheet = _stylesheet(key, button_type, theme or DEFAULT_THEME, icon, _page_mode(mode))
+    st.markdown(stylesheet, unsafe_allow_html=True)
+    return st.button(
+        label,
+        key=key,
+        disabled=disabled,
+        use_container_width=use_container_width,
+        on_click=on_click,
+        args=args,
+        kwargs=kwargs,
+    )
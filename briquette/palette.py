@@ -0,0 +1,395 @@
+"""
+Palette presets and WCAG contrast audits
+
+``PRESETS`` holds the page-level schemes the color tuners start from, in
+``inject_carbon_styles`` form (``briquette.styles.THEME_KEYS``) for both
+modes, and ``BUTTON_PRESETS`` the single-button ``colors=`` dicts.
+
+``audit(themes)`` checks any number of palettes at once. Colors are
+parsed into one NumPy array, so the relative luminance and contrast ratio
+of every (bg, text) and (page_bg, border) pair, in every state of every
+palette, is computed in a single vectorized pass over the whole library.
+
+Text is held to WCAG 2.1's 4.5:1 against the button's own background
+(1.4.3, AA). Borders are measured against the page background they sit
+on, the adjacent color 1.4.11 is about, so only palettes with a
+``page_bg`` have border ratios. They are reported but are not failures
+unless asked for: a button labelled with text doesn't need a visible
+boundary, so subtle borders are a design choice. Disabled controls are
+exempt from both minimums. Only hex colors can be measured; anything else
+(``transparent``, named or ``rgb()`` colors) gives a NaN ratio and is
+never a failure.
+"""
+
+import numpy as np
+
+from .theme import Theme
+
+# States a palette may set, in either naming: "click" in page-level
+# schemes, "active" in button colors
+STATES = ("rest", "hover", "active", "click", "disabled")
+
+# The colors measured in each state: text against the state's
+# background, borders against the page background
+PARTS = ("text", "border")
+
+# Minimum contrast ratio per part
+TEXT_RATIO = 4.5
+BORDER_RATIO = 3.0
+
+PRESETS = {
+    "default": {
+        "light": {
+            "page_bg": "#ffffff",
+            "rest_bg": "#e0e0e0",
+            "rest_text": "#1a1a1a",
+            "rest_border": "#cccccc",
+            "hover_bg": "#f5f5f5",
+            "hover_text": "#000000",
+            "hover_border": "#b0b0b0",
+            "click_bg": "#c0c0c0",
+            "click_text": "#000000",
+            "click_border": "#999999",
+            "disabled_bg": "#f0f0f0",
+            "disabled_text": "#999999",
+            "disabled_border": "#e0e0e0",
+        },
+        "dark": {
+            "page_bg": "#1a1a1a",
+            "rest_bg": "#3a3a3a",
+            "rest_text": "#e0e0e0",
+            "rest_border": "#4a4a4a",
+            "hover_bg": "#4a4a4a",
+            "hover_text": "#ffffff",
+            "hover_border": "#5a5a5a",
+            "click_bg": "#2a2a2a",
+            "click_text": "#ffffff",
+            "click_border": "#1a1a1a",
+            "disabled_bg": "#2a2a2a",
+            "disabled_text": "#666666",
+            "disabled_border": "#3a3a3a",
+        },
+    },
+    "carbon_classic": {
+        "light": {
+            "page_bg": "#ffffff",
+            "rest_bg": "#f4f4f4",
+            "rest_text": "#161616",
+            "rest_border": "#e0e0e0",
+            "hover_bg": "#e0e0e0",
+            "hover_text": "#161616",
+            "hover_border": "#c6c6c6",
+            "click_bg": "#c6c6c6",
+            "click_text": "#161616",
+            "click_border": "#a8a8a8",
+            "disabled_bg": "#ffffff",
+            "disabled_text": "#c6c6c6",
+            "disabled_border": "#e0e0e0",
+        },
+        "dark": {
+            "page_bg": "#161616",
+            "rest_bg": "#393939",
+            "rest_text": "#f4f4f4",
+            "rest_border": "#525252",
+            "hover_bg": "#4c4c4c",
+            "hover_text": "#ffffff",
+            "hover_border": "#6f6f6f",
+            "click_bg": "#262626",
+            "click_text": "#ffffff",
+            "click_border": "#161616",
+            "disabled_bg": "#262626",
+            "disabled_text": "#525252",
+            "disabled_border": "#393939",
+        },
+    },
+    "high_contrast": {
+        "light": {
+            "page_bg": "#ffffff",
+            "rest_bg": "#333333",
+            "rest_text": "#ffffff",
+            "rest_border": "#000000",
+            "hover_bg": "#000000",
+            "hover_text": "#ffffff",
+            "hover_border": "#000000",
+            "click_bg": "#666666",
+            "click_text": "#ffffff",
+            "click_border": "#333333",
+            "disabled_bg": "#cccccc",
+            "disabled_text": "#666666",
+            "disabled_border": "#999999",
+        },
+        "dark": {
+            "page_bg": "#000000",
+            "rest_bg": "#ffffff",
+            "rest_text": "#000000",
+            "rest_border": "#ffffff",
+            "hover_bg": "#cccccc",
+            "hover_text": "#000000",
+            "hover_border": "#999999",
+            "click_bg": "#333333",
+            "click_text": "#ffffff",
+            "click_border": "#000000",
+            "disabled_bg": "#333333",
+            "disabled_text": "#666666",
+            "disabled_border": "#444444",
+        },
+    },
+    "subtle": {
+        "light": {
+            "page_bg": "#fafafa",
+            "rest_bg": "#f5f5f5",
+            "rest_text": "#333333",
+            "rest_border": "#f0f0f0",
+            "hover_bg": "#ffffff",
+            "hover_text": "#000000",
+            "hover_border": "#e0e0e0",
+            "click_bg": "#e8e8e8",
+            "click_text": "#000000",
+            "click_border": "#d0d0d0",
+            "disabled_bg": "#fafafa",
+            "disabled_text": "#b0b0b0",
+            "disabled_border": "#f5f5f5",
+        },
+        "dark": {
+            "page_bg": "#1e1e1e",
+            "rest_bg": "#2d2d2d",
+            "rest_text": "#d4d4d4",
+            "rest_border": "#404040",
+            "hover_bg": "#3a3a3a",
+            "hover_text": "#ffffff",
+            "hover_border": "#525252",
+            "click_bg": "#252525",
+            "click_text": "#ffffff",
+            "click_border": "#1a1a1a",
+            "disabled_bg": "#252525",
+            "disabled_text": "#606060",
+            "disabled_border": "#353535",
+        },
+    },
+}
+
+BUTTON_PRESETS = {
+    "default": {
+        "rest_bg": "#e0e0e0",
+        "rest_text": "#1a1a1a",
+        "rest_border": "#cccccc",
+        "hover_bg": "#f5f5f5",
+        "hover_text": "#000000",
+        "hover_border": "#b0b0b0",
+        "active_bg": "#606060",
+        "active_text": "#ffffff",
+        "active_border": "#404040",
+    },
+    "high_contrast": {
+        "rest_bg": "#d0d0d0",
+        "rest_text": "#000000",
+        "rest_border": "#a0a0a0",
+        "hover_bg": "#e8e8e8",
+        "hover_text": "#000000",
+        "hover_border": "#808080",
+        "active_bg": "#303030",
+        "active_text": "#ffffff",
+        "active_border": "#000000",
+    },
+    "subtle": {
+        "rest_bg": "#f8f8f8",
+        "rest_text": "#333333",
+        "rest_border": "#e8e8e8",
+        "hover_bg": "#ffffff",
+        "hover_text": "#000000",
+        "hover_border": "#d0d0d0",
+        "active_bg": "#e0e0e0",
+        "active_text": "#000000",
+        "active_border": "#c0c0c0",
+    },
+    "dark": {
+        "rest_bg": "#3a3a3a",
+        "rest_text": "#e0e0e0",
+        "rest_border": "#4a4a4a",
+        "hover_bg": "#4a4a4a",
+        "hover_text": "#ffffff",
+        "hover_border": "#5a5a5a",
+        "active_bg": "#1a1a1a",
+        "active_text": "#ffffff",
+        "active_border": "#0a0a0a",
+    },
+}
+
+
+def button_colors(palette: dict) -> dict:
+    """A page-level palette's button colors as a ``carbon_button`` ``colors=`` dict."""
+    colors = {}
+    for name, value in palette.items():
+        state, _, part = name.partition("_")
+        if state == "click":
+            state = "active"
+        if state in ("rest", "hover", "active") and part in ("bg",) + PARTS:
+            colors[f"{state}_{part}"] = value
+    return colors
+
+
+def _rgb(color) -> int:
+    # 0xRRGGBB, or -1 for anything that isn't a hex color
+    if not isinstance(color, str) or not color.startswith("#"):
+        return -1
+    digits = color[1:].strip()
+    if len(digits) in (3, 4):
+        digits = "".join(c * 2 for c in digits[:3])
+    elif len(digits) in (6, 8):
+        digits = digits[:6]
+    else:
+        return -1
+    try:
+        return int(digits, 16)
+    except ValueError:
+        return -1
+
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """
+    WCAG relative luminance of packed ``0xRRGGBB`` colors.
+
+    ``rgb`` is an integer array of any shape; negative entries (colors
+    that couldn't be parsed) give NaN.
+    """
+    rgb = np.asarray(rgb, dtype=np.int64)
+    channels = np.stack([(rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF], axis=-1) / 255.0
+    linear = np.where(channels <= 0.03928, channels / 12.92, ((channels + 0.055) / 1.055) ** 2.4)
+    luminance = linear @ np.array([0.2126, 0.7152, 0.0722])
+    return np.where(rgb < 0, np.nan, luminance)
+
+
+def contrast_ratio(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """WCAG contrast ratio between two arrays of relative luminance."""
+    lighter = np.fmax(first, second)
+    darker = np.fmin(first, second)
+    ratio = (lighter + 0.05) / (darker + 0.05)
+    return np.where(np.isnan(first) | np.isnan(second), np.nan, ratio)
+
+
+def _is_palette(value) -> bool:
+    return isinstance(value, dict) and any(isinstance(color, str) for color in value.values())
+
+
+def _flatten(name, theme) -> list:
+    # (name, palette) pairs for one entry of audit()'s input
+    prefix = f"{name}/" if name is not None else ""
+    if isinstance(theme, Theme):
+        return [
+            (f"{prefix}{mode}/{button_type}", palette)
+            for mode, palettes in theme.palettes.items()
+            for button_type, palette in palettes.items()
+        ]
+    if isinstance(theme, dict) and not _is_palette(theme):
+        # A {"light": palette, "dark": palette} scheme
+        return [(f"{prefix}{mode}", palette) for mode, palette in theme.items()]
+    return [(name, theme)]
+
+
+class Audit:
+    """
+    Contrast ratios for a batch of palettes.
+
+    ``ratios[i, j]`` is the ratio of ``pairs[j]``, a ``(state, part)``
+    tuple, in palette ``names[i]``: text against the state's background,
+    border against ``page_bg``. NaN if the palette doesn't set both colors
+    or they aren't hex.
+    """
+
+    def __init__(self, names: list, pairs: list, ratios: np.ndarray):
+        self.names = names
+        self.pairs = pairs
+        self.ratios = ratios
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _failing(self, include_disabled: bool = False, include_borders: bool = False) -> np.ndarray:
+        required = np.array([
+            0.0 if state == "disabled" and not include_disabled
+            else TEXT_RATIO if part == "text"
+            else BORDER_RATIO if include_borders
+            else 0.0
+            for state, part in self.pairs
+        ])
+        # NaN compares False, so unmeasured pairs never fail
+        return self.ratios < required
+
+    def passed(self, include_borders: bool = False) -> np.ndarray:
+        """Per palette, True if every measured text pair meets its minimum."""
+        return ~self._failing(include_borders=include_borders).any(axis=1)
+
+    def worst(self) -> np.ndarray:
+        """Per palette, its lowest text contrast outside the disabled state."""
+        text = [j for j, (state, part) in enumerate(self.pairs) if part == "text" and state != "disabled"]
+        if not text:
+            return np.full(len(self.names), np.nan)
+        return np.fmin.reduce(self.ratios[:, text], axis=1)
+
+    def failures(self, include_disabled: bool = False, include_borders: bool = False) -> list:
+        """
+        ``(name, state, part, ratio)`` for every pair below its minimum.
+
+        Borders are only held to ``BORDER_RATIO`` against the page with
+        ``include_borders=True``, e.g. for buttons without a text label.
+        """
+        return [
+            (self.names[i], *self.pairs[j], float(self.ratios[i, j]))
+            for i, j in zip(*np.nonzero(self._failing(include_disabled, include_borders)))
+        ]
+
+
+def audit(themes) -> Audit:
+    """
+    Measure the WCAG contrast of every state of every palette in ``themes``.
+
+    Parameters
+    ----------
+    themes : dict, list or Theme
+        A single palette (a dict like ``{"rest_bg": ..., "rest_text":
+        ...}``), a list of them, or a dict of them by name. A named entry
+        may also be a ``{"light": palette, "dark": palette}`` scheme such
+        as those in ``PRESETS``, or a ``briquette.Theme``, which is
+        audited per mode and button type.
+
+    Returns
+    -------
+    Audit
+        The ratios, with ``failures()`` and ``passed()`` to check them
+        against the WCAG minimums. Borders are measured against the
+        palette's ``page_bg``.
+    """
+    if isinstance(themes, Theme) or _is_palette(themes):
+        named = _flatten(None, themes)
+    elif isinstance(themes, dict):
+        named = [pair for name, theme in themes.items() for pair in _flatten(name, theme)]
+    else:
+        named = [pair for index, theme in enumerate(themes) for pair in _flatten(index, theme)]
+
+    # Text is read against the button's background, the border against
+    # the page around it
+    backgrounds = {"text": "{state}_bg", "border": "page_bg"}
+    measured = [
+        ((state, part), (backgrounds[part].format(state=state), f"{state}_{part}"))
+        for state in STATES
+        for part in PARTS
+        if any(
+            backgrounds[part].format(state=state) in palette and f"{state}_{part}" in palette
+            for _, palette in named
+        )
+    ]
+    pairs = [pair for pair, _ in measured]
+    columns = [column for _, column in measured]
+
+    # Gather the colors as one (palettes, pairs, bg/fg) array of strings
+    # and parse each distinct color once; palettes in a library share most
+    colors = np.array(
+        [[palette.get(name, "") for names in columns for name in names] for _, palette in named],
+        dtype=object,
+    ).reshape(len(named), len(pairs), 2)
+    distinct, index = np.unique(colors.astype(str), return_inverse=True)
+    rgb = np.array([_rgb(color) for color in distinct], dtype=np.int64)[index.reshape(colors.shape)]
+    luminance = relative_luminance(rgb)
+
+    ratios = contrast_ratio(luminance[..., 0], luminance[..., 1])
+    return Audit([name for name, _ in named], pairs, ratios)
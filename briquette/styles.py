@@ -0,0 +1,192 @@
+"""
+Page-level styles for Streamlit's own buttons
+
+``inject_carbon_styles(theme)`` restyles ``st.button`` (the secondary and
+ghost kinds) to match the Carbon look. A theme is a dict of colors with
+the keys in ``THEME_KEYS``, as exported by ``color_tuner.py``; missing
+keys fall back to ``DEFAULT_THEME``.
+
+The CSS for a theme is compiled once per process and cached by a hash of
+the theme, so every session using the same theme shares one string.
+Within a run, repeated calls with the same theme emit it only once.
+Streamlit drops elements that a rerun doesn't emit again, so the
+stylesheet is still written once per run.
+"""
+
+import hashlib
+import json
+import threading
+
+from .theme import is_color
+
+# Colors a theme may set
+THEME_KEYS = (
+    "page_bg",
+    "rest_bg", "rest_text", "rest_border",
+    "hover_bg", "hover_text", "hover_border",
+    "click_bg", "click_text", "click_border",
+    "disabled_bg", "disabled_text", "disabled_border",
+)
+
+DEFAULT_THEME = {
+    "rest_bg": "#e6e2e2",
+    "rest_text": "#1a1a1a",
+    "rest_border": "#cccccc",
+    "hover_bg": "#f5f5f5",
+    "hover_text": "#000000",
+    "hover_border": "#b0b0b0",
+    "click_bg": "#50e4e0",  # Teal accent on click
+    "click_text": "#ffffff",
+    "click_border": "#404040",
+}
+
+# Maximum number of compiled themes kept in memory
+CACHE_SIZE = 64
+
+# Streamlit renamed the test ids in 1.37; match both
+_SECONDARY = 'button[data-testid="baseButton-secondary"], button[data-testid="stBaseButton-secondary"]'
+_GHOST = 'button[data-testid="baseButton-ghost"], button[data-testid="stBaseButton-ghost"]'
+
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+
+def _state(selector: str, state: str) -> str:
+    return ", ".join(f"{part}{state}" for part in selector.split(", "))
+
+
+# The ghost style doesn't depend on the theme
+_GHOST_CSS = f"""
+{_GHOST} {{
+    background-color: transparent !important;
+    color: #393939 !important;
+    border: 1px solid #e0e0e0 !important;
+    transition: all 0.2s ease !important;
+}}
+{_state(_SECONDARY, ":focus")} {{
+    outline: none !important;
+    border: none !important;
+    box-shadow: 0 1px 2px rgba(0,0,0,0.05) !important;
+}}
+{_state(_GHOST, ":hover")} {{
+    background-color: #fafafa !important;
+    color: #161616 !important;
+    border-color: #d0d0d0 !important;
+}}
+{_state(_GHOST, ":active")} {{
+    background-color: #e0e0e0 !important;
+    color: #161616 !important;
+}}
+{_state(_GHOST, ":focus")} {{
+    outline: none !important;
+    border-color: #e0e0e0 !important;
+}}
+/* Ensure icons stay visible */
+.carbon-button-icon svg {{
+    fill: currentColor !important;
+}}
+"""
+
+
+def validate_theme(theme: dict) -> dict:
+    """
+    Return ``theme`` with ``DEFAULT_THEME`` filled in.
+
+    Raises ``ValueError`` for unknown keys or values that aren't colors.
+    """
+    unknown = set(theme) - set(THEME_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown theme keys: {', '.join(sorted(unknown))}")
+    for name, value in theme.items():
+        if not is_color(value):
+            raise ValueError(f"Invalid color for {name}: {value!r}")
+    return dict(DEFAULT_THEME, **theme)
+
+
+def theme_hash(theme: dict) -> str:
+    """A stable hash of ``theme``'s colors."""
+    data = json.dumps(theme, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _compile(theme: dict) -> str:
+    css = f"""
+{_SECONDARY} {{
+    background-color: {theme['rest_bg']} !important;
+    color: {theme['rest_text']} !important;
+    border: 1px solid {theme['rest_border']} !important;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1) !important;
+    transition: all 0.15s ease !important;
+}}
+{_state(_SECONDARY, ":hover")} {{
+    background-color: {theme['hover_bg']} !important;
+    color: {theme['hover_text']} !important;
+    border-color: {theme['hover_border']} !important;
+    transform: translateY(-1px) !important;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.15) !important;
+}}
+{_state(_SECONDARY, ":active")} {{
+    background-color: {theme['click_bg']} !important;
+    color: {theme['click_text']} !important;
+    border-color: {theme['click_border']} !important;
+    transform: translateY(0) !important;
+    box-shadow: inset 0 2px 4px rgba(0,0,0,0.1) !important;
+}}
+"""
+    if "disabled_bg" in theme:
+        css += f"""
+{_state(_SECONDARY, ":disabled")} {{
+    background-color: {theme['disabled_bg']} !important;
+    color: {theme.get('disabled_text', theme['rest_text'])} !important;
+    border-color: {theme.get('disabled_border', theme['rest_border'])} !important;
+    opacity: 1 !important;
+}}
+"""
+    if "page_bg" in theme:
+        css += f"""
+.stApp {{
+    background-color: {theme['page_bg']};
+}}
+"""
+    return "<style>" + css + _GHOST_CSS + "</style>"
+
+
+def compile_theme(theme: dict = None) -> tuple:
+    """
+    Return ``(hash, stylesheet)`` for ``theme``, compiling it at most once.
+
+    Raises ``ValueError`` for unknown keys or values that aren't colors.
+    """
+    theme = theme or {}
+    digest = theme_hash(theme)
+    with _compiled_lock:
+        css = _compiled.get(digest)
+    if css is None:
+        css = _compile(validate_theme(theme))
+        with _compiled_lock:
+            if len(_compiled) >= CACHE_SIZE:
+                _compiled.pop(next(iter(_compiled)))
+            _compiled[digest] = css
+    return digest, css
+
+
+def inject_carbon_styles(theme: dict = None):
+    """
+    Style ``st.button`` to match Carbon buttons.
+
+    Call this near the top of your app, once per run.
+
+    Parameters
+    ----------
+    theme : dict
+        Colors keyed by ``THEME_KEYS`` (e.g. one mode of the scheme
+        exported by ``color_tuner.py``). Missing keys use
+        ``DEFAULT_THEME``.
+    """
+    import streamlit as st
+
+    from ._runtime import current_run
+
+    digest, css = compile_theme(theme)
+    if current_run().first_in_run(f"styles:{digest}"):
+        st.markdown(css, unsafe_allow_html=True)
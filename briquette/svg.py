@@ -0,0 +1,181 @@
+"""
+SVG normalization for custom icons
+
+Icons passed to the frontend end up in ``dangerouslySetInnerHTML``, so
+anything that isn't a built-in ``CarbonIcons`` member goes through
+``normalize_svg`` first. It:
+
+- keeps only SVG shape and structure elements and presentation
+  attributes, matched case-insensitively; scripts, event handlers,
+  animation, links, ``foreignObject`` and editor cruft are dropped
+- collapses whitespace in path data
+- removes hard-coded fills so the icon follows the button's text color
+- drops ``width``/``height`` so the button's CSS controls the size
+
+Results are kept in a bounded LRU keyed by a hash of the input, so each
+distinct icon is processed once and later reruns pay a dictionary lookup.
+"""
+
+import hashlib
+import re
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+# Maximum number of normalized icons kept in memory
+CACHE_SIZE = 512
+
+# Elements an icon may contain, by lower-case name. Everything else is
+# dropped with its subtree: <a>, <set> and <animate*> can retarget links,
+# and <foreignObject> embeds HTML, in any letter case.
+_ALLOWED_ELEMENTS = {name.lower(): name for name in (
+    "svg", "g", "defs", "symbol", "use", "path", "rect", "circle", "ellipse", "line",
+    "polyline", "polygon", "clipPath", "mask", "linearGradient", "radialGradient", "stop",
+)}
+
+# Geometry and presentation attributes, by lower-case name
+_ALLOWED_ATTRIBUTES = {name.lower(): name for name in (
+    "id", "href", "d", "points", "x", "y", "x1", "y1", "x2", "y2", "cx", "cy", "r", "rx",
+    "ry", "fx", "fy", "width", "height", "viewBox", "preserveAspectRatio", "transform",
+    "pathLength", "offset", "gradientUnits", "gradientTransform", "spreadMethod",
+    "clipPathUnits", "maskUnits", "maskContentUnits", "fill", "fill-rule", "fill-opacity",
+    "stroke", "stroke-width", "stroke-linecap", "stroke-linejoin", "stroke-miterlimit",
+    "stroke-dasharray", "stroke-dashoffset", "stroke-opacity", "opacity", "clip-path",
+    "clip-rule", "mask", "stop-color", "stop-opacity", "display", "visibility",
+)}
+
+# url(...) references may only point inside the icon
+_EXTERNAL_URL = re.compile(r"url\(\s*['\"]?\s*[^#'\"\s]", re.IGNORECASE)
+
+# Attributes whose value is path-like data worth compacting
+_PATH_ATTRIBUTES = {"d", "points"}
+
+_DOCTYPE = re.compile(r"<!DOCTYPE[^>[]*(\[[^\]]*\])?\s*>", re.IGNORECASE)
+_PATH_WHITESPACE = re.compile(r"\s*([a-zA-Z,])\s*")
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _local_name(name: str) -> str:
+    return name.rsplit("}", 1)[-1]
+
+
+def _namespace(name: str) -> str:
+    return name[1:].split("}", 1)[0] if name.startswith("{") else ""
+
+
+def _clean_attributes(element, is_root: bool):
+    for name in list(element.attrib):
+        value = element.attrib.pop(name)
+        namespace = _namespace(name)
+        local = _ALLOWED_ATTRIBUTES.get(_local_name(name).lower())
+
+        # Unknown, event handler, style and editor (inkscape:, sodipodi:)
+        # attributes are simply not put back
+        if local is None or namespace not in ("", SVG_NS, XLINK_NS):
+            continue
+        if namespace == XLINK_NS and local != "href":
+            continue
+        if local == "href":
+            if value.strip().startswith("#"):
+                element.attrib[f"{{{XLINK_NS}}}href" if namespace == XLINK_NS else "href"] = value.strip()
+        elif _EXTERNAL_URL.search(value):
+            continue
+        elif local == "fill":
+            if value == "none":
+                element.attrib[local] = value
+        elif local == "stroke":
+            element.attrib[local] = value if value == "none" else "currentColor"
+        elif local in _PATH_ATTRIBUTES:
+            element.attrib[local] = _PATH_WHITESPACE.sub(r"\1", " ".join(value.split()))
+        else:
+            element.attrib[local] = value
+
+    if is_root:
+        width = element.attrib.pop("width", None)
+        height = element.attrib.pop("height", None)
+        if "viewBox" not in element.attrib and width and height:
+            element.attrib["viewBox"] = f"0 0 {width.rstrip('px')} {height.rstrip('px')}"
+        # Stroke-only icons keep fill="none"; everything else inherits color
+        element.attrib.setdefault("fill", "currentColor")
+
+
+def _allowed_tag(tag):
+    """The canonical tag for an allowed element, or None."""
+    if not isinstance(tag, str):  # comments and processing instructions
+        return None
+    namespace = _namespace(tag)
+    local = _ALLOWED_ELEMENTS.get(_local_name(tag).lower())
+    if local is None or namespace not in ("", SVG_NS):
+        return None
+    return f"{{{namespace}}}{local}" if namespace else local
+
+
+def _clean_tree(element, is_root: bool = False):
+    _clean_attributes(element, is_root)
+    for child in list(element):
+        tag = _allowed_tag(child.tag)
+        if tag is None:
+            element.remove(child)
+            continue
+        child.tag = tag
+        _clean_tree(child)
+        if child.tail is not None and not child.tail.strip():
+            child.tail = None
+    if element.text is not None and not element.text.strip():
+        element.text = None
+
+
+def _normalize(svg: str) -> str:
+    if "<!ENTITY" in svg:
+        raise ValueError("Invalid SVG icon: entity declarations are not allowed")
+    source = _DOCTYPE.sub("", svg).strip()
+    try:
+        root = ET.fromstring(source)
+    except ET.ParseError as e:
+        raise ValueError(f"Invalid SVG icon: {e}") from None
+    if _allowed_tag(root.tag) is None or _local_name(root.tag).lower() != "svg":
+        raise ValueError(f"Invalid SVG icon: root element is <{_local_name(root.tag)}>, expected <svg>")
+    root.tag = _allowed_tag(root.tag)
+    _clean_tree(root, is_root=True)
+    return ET.tostring(root, encoding="unicode").replace(" />", "/>")
+
+
+def normalize_svg(svg: str) -> str:
+    """
+    Return a minified, sanitized copy of ``svg`` that inherits its color.
+
+    Raises ``ValueError`` if ``svg`` is not a well-formed ``<svg>`` document.
+    """
+    digest = hashlib.blake2b(svg.encode("utf-8"), digest_size=16).digest()
+    with _cache_lock:
+        normalized = _cache.get(digest)
+        if normalized is not None:
+            _cache.move_to_end(digest)
+            return normalized
+
+    normalized = _normalize(svg)
+
+    with _cache_lock:
+        _cache[digest] = normalized
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return normalized
+
+
+def cache_size() -> int:
+    """Number of normalized icons currently cached."""
+    return len(_cache)
+
+
+def clear_cache():
+    """Forget every normalized icon."""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,139 @@
+"""
+Frontend performance telemetry
+
+Set ``STREAMLIT_CARBON_BUTTON_TELEMETRY=true`` to have every component
+button measure, in the browser, how long it took to mount and to first
+paint, how often it rendered and how long each click took to be
+acknowledged by a rerun. Measurements are batched and ride along with
+the next click the button sends. So that a button that is never clicked
+still reports its mount and first paint, and the last click's latency
+isn't lost, a button also sends a batch of its own after its first
+paint and after each acknowledged click; each of those costs a rerun.
+``button_metrics()`` returns the session's aggregates.
+
+Only ``carbon_button`` buttons drawn as components are measured; native
+buttons, groups, grids, tables and the color tuner report nothing.
+
+Telemetry is off by default and then costs nothing: nothing is measured
+in the browser and nothing extra is sent.
+"""
+
+import os
+
+ENABLED = os.getenv("STREAMLIT_CARBON_BUTTON_TELEMETRY", "").lower() == "true"
+
+
+def report_id(value):
+    """``(nonce, seq)`` of a batch the frontend sent without a click, or None."""
+    if not isinstance(value, dict) or not isinstance(value.get("report"), dict):
+        return None
+    report = value["report"]
+    nonce, seq = report.get("nonce"), report.get("seq")
+    if nonce is None or seq is None:
+        return None
+    return nonce, seq
+
+
+class Summary:
+    """Count, total, min and max of a stream of timings in milliseconds."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else None
+
+    def dump(self) -> dict:
+        return {"count": self.count, "mean": self.mean, "min": self.min, "max": self.max}
+
+
+class ButtonMetrics:
+    """Aggregated telemetry for one button key."""
+
+    def __init__(self):
+        self.mount_ms = Summary()
+        self.first_paint_ms = Summary()
+        self.click_ack_ms = Summary()
+        self.renders = 0
+        self.batches = 0
+        # The last report recorded, so reruns don't count it again
+        self.last_report = None
+
+    def record(self, batch: dict):
+        self.batches += 1
+        self.renders += int(batch.get("renders", 0))
+        if batch.get("mountMs") is not None:
+            self.mount_ms.add(float(batch["mountMs"]))
+        if batch.get("firstPaintMs") is not None:
+            self.first_paint_ms.add(float(batch["firstPaintMs"]))
+        for latency in batch.get("ackMs") or ():
+            self.click_ack_ms.add(float(latency))
+
+    def dump(self) -> dict:
+        return {
+            "mounts": self.mount_ms.count,
+            "mount_ms": self.mount_ms.dump(),
+            "first_paint_ms": self.first_paint_ms.dump(),
+            "renders": self.renders,
+            "click_ack_ms": self.click_ack_ms.dump(),
+            "batches": self.batches,
+        }
+
+
+class SessionMetrics:
+    """A session's telemetry, by button key."""
+
+    def __init__(self):
+        self._buttons = {}
+
+    def record(self, key: str, batch):
+        """Fold a batch the frontend sent with a click (or a report) into the totals."""
+        if not isinstance(batch, dict):
+            return
+        metrics = self._buttons.get(key)
+        if metrics is None:
+            metrics = self._buttons[key] = ButtonMetrics()
+        metrics.record(batch)
+
+    def record_report(self, key: str, value):
+        """Fold in a batch the frontend sent without a click, once per report."""
+        report = report_id(value)
+        if report is None:
+            return
+        metrics = self._buttons.get(key)
+        if metrics is not None and metrics.last_report == report:
+            return
+        self.record(key, value.get("telemetry"))
+        if key in self._buttons:
+            self._buttons[key].last_report = report
+
+    def __len__(self) -> int:
+        return len(self._buttons)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._buttons
+
+    def get(self, key: str) -> ButtonMetrics:
+        return self._buttons.get(key)
+
+    def dump(self) -> dict:
+        """Every button's aggregates as plain dicts, e.g. for ``st.json``."""
+        return {key: metrics.dump() for key, metrics in self._buttons.items()}
+
+    def prune(self, live):
+        """Forget buttons whose key isn't in ``live`` (the click ledger)."""
+        for key in [key for key in self._buttons if key not in live]:
+            del self._buttons[key]
+
+    def clear(self):
+        self._buttons.clear()
@@ -0,0 +1,196 @@
+"""
+Button themes
+
+A ``Theme`` holds the colors of every button type, in every state, for
+both light and dark mode. It is validated and compiled once, when it is
+created, into a table of CSS custom properties
+(``--cb-<type>-<state>-<part>``) that the frontend applies with a single
+style assignment per render; hover and active colors are then plain CSS.
+Create themes once (e.g. at module level) and pass them to the buttons.
+
+The defaults mirror the ``.carbon-theme`` rules in
+``frontend/src/index.css``, so only the entries a theme changes are sent
+to the browser.
+"""
+
+import hashlib
+import json
+import re
+from functools import lru_cache
+
+BUTTON_TYPES = ("primary", "secondary", "danger", "ghost")
+STATES = ("rest", "hover", "active")
+PARTS = ("bg", "text", "border")
+MODES = ("light", "dark")
+
+# The keys of a per-type color dict, e.g. "hover_bg"
+COLOR_KEYS = tuple(f"{state}_{part}" for state in STATES for part in PARTS)
+
+_COLOR = re.compile(r"^(#[0-9a-fA-F]{3,8}|[a-zA-Z]+|(rgb|rgba|hsl|hsla)\([0-9.,%\s]+\))$")
+
+_TEXT = {"primary": "#ffffff", "secondary": "#1a1a1a", "danger": "#ffffff", "ghost": "#262626"}
+
+
+def is_color(value) -> bool:
+    """True if ``value`` looks like a CSS color (hex, name or function)."""
+    return isinstance(value, str) and bool(_COLOR.match(value.strip()))
+
+
+def _palette(rest_bg, border, hover_bg, active_bg, secondary_active_text):
+    palette = {}
+    for button_type in BUTTON_TYPES:
+        active_text = secondary_active_text if button_type == "secondary" else _TEXT[button_type]
+        palette[button_type] = {
+            "rest_bg": rest_bg[button_type],
+            "rest_text": _TEXT[button_type],
+            "rest_border": border[button_type],
+            "hover_bg": hover_bg[button_type],
+            "hover_text": _TEXT[button_type],
+            "hover_border": border[button_type],
+            "active_bg": active_bg[button_type],
+            "active_text": active_text,
+            "active_border": border[button_type],
+        }
+    return palette
+
+
+DEFAULT_COLORS = {
+    "light": _palette(
+        rest_bg={"primary": "#0f62fe", "secondary": "#e6e2e2", "danger": "#da1e28", "ghost": "transparent"},
+        border={"primary": "#0f62fe", "secondary": "#cccccc", "danger": "#da1e28", "ghost": "transparent"},
+        hover_bg={"primary": "#0043ce", "secondary": "#f5f5f5", "danger": "#ba1b23", "ghost": "#e0e0e0"},
+        active_bg={"primary": "#002d9c", "secondary": "#50e4e0", "danger": "#750e13", "ghost": "#c0c0c0"},
+        secondary_active_text="#ffffff",
+    ),
+    "dark": _palette(
+        rest_bg={"primary": "#0f62fe", "secondary": "#ecdcdc", "danger": "#da1e28", "ghost": "transparent"},
+        border={"primary": "#0f62fe", "secondary": "#404040", "danger": "#da1e28", "ghost": "transparent"},
+        hover_bg={"primary": "#0043ce", "secondary": "#f6f4f4", "danger": "#ba1b23", "ghost": "#e0e0e0"},
+        active_bg={"primary": "#002d9c", "secondary": "#67cccc", "danger": "#750e13", "ghost": "#c0c0c0"},
+        secondary_active_text="#000000",
+    ),
+}
+
+
+def variable_name(button_type: str, color_key: str) -> str:
+    """The CSS custom property for ``color_key`` of ``button_type``."""
+    state, part = color_key.split("_")
+    return f"--cb-{button_type}-{state}-{part}"
+
+
+def _check_overrides(mode: str, overrides: dict):
+    for button_type, colors in overrides.items():
+        if button_type not in BUTTON_TYPES:
+            raise ValueError(f"Unknown button type in {mode} theme: {button_type!r}")
+        for color_key, value in colors.items():
+            if color_key not in COLOR_KEYS:
+                raise ValueError(f"Unknown color {color_key!r} for {button_type} buttons")
+            if not is_color(value):
+                raise ValueError(f"Invalid color for {button_type} {color_key}: {value!r}")
+
+
+class Theme:
+    """
+    Colors for every button type, state and mode.
+
+    Parameters
+    ----------
+    light : dict
+        Overrides for light mode, keyed by button type ("primary",
+        "secondary", "danger", "ghost"), each a dict of ``COLOR_KEYS``
+        (rest_bg, hover_text, active_border, ...).
+    dark : dict
+        Overrides for dark mode, in the same form. Defaults to ``light``'s
+        overrides, so a theme that only sets light colors applies them
+        in both modes.
+
+    Raises ``ValueError`` for unknown button types, color keys or values
+    that aren't CSS colors.
+    """
+
+    def __init__(self, light: dict = None, dark: dict = None):
+        light = light or {}
+        dark = light if dark is None else dark
+        overrides = {"light": light, "dark": dark}
+        for mode in MODES:
+            _check_overrides(mode, overrides[mode])
+
+        self.palettes = {}
+        self.variables = {}
+        # Only the entries that differ from the stylesheet's defaults
+        self.overrides = {}
+        for mode in MODES:
+            palettes = {}
+            variables = {}
+            changed = {}
+            for button_type in BUTTON_TYPES:
+                palette = dict(DEFAULT_COLORS[mode][button_type], **overrides[mode].get(button_type, {}))
+                palettes[button_type] = palette
+                for color_key, value in palette.items():
+                    name = variable_name(button_type, color_key)
+                    variables[name] = value
+                    if value != DEFAULT_COLORS[mode][button_type][color_key]:
+                        changed[name] = value
+            self.palettes[mode] = palettes
+            self.variables[mode] = variables
+            self.overrides[mode] = changed
+
+        data = json.dumps(self.variables, sort_keys=True).encode("utf-8")
+        self.hash = hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    @classmethod
+    def from_colors(cls, colors: dict, button_type: str = None) -> "Theme":
+        """
+        Build a theme from a ``colors`` dict of ``COLOR_KEYS``.
+
+        The colors apply to ``button_type`` (every type if None) in both
+        modes. Themes are cached, so passing the same dict on every rerun
+        compiles it once.
+        """
+        return _theme_from_colors(tuple(sorted(colors.items())), button_type)
+
+    def palette(self, mode: str, button_type: str) -> dict:
+        """The resolved colors of ``button_type`` in ``mode``."""
+        return self.palettes[mode].get(button_type, self.palettes[mode]["primary"])
+
+    def __eq__(self, other):
+        return isinstance(other, Theme) and other.hash == self.hash
+
+    def __hash__(self):
+        return hash(self.hash)
+
+    def __repr__(self):
+        return f"Theme({self.hash})"
+
+
+@lru_cache(maxsize=256)
+def _theme_from_colors(colors: tuple, button_type: str) -> Theme:
+    types = BUTTON_TYPES if button_type is None else (button_type,)
+    overrides = {name: dict(colors) for name in types}
+    return Theme(light=overrides, dark=overrides)
+
+
+DEFAULT_THEME = Theme()
+
+
+def resolve_theme(theme: Theme, colors: dict, button_type: str = None) -> Theme:
+    """The theme a button renders with, from its ``theme`` and ``colors``."""
+    if theme is not None and colors:
+        raise ValueError("Pass either theme or colors, not both")
+    if colors:
+        return Theme.from_colors(colors, button_type)
+    return theme or DEFAULT_THEME
+
+
+def check_mode(mode: str) -> str:
+    """Validate a button's ``mode=`` ("auto", "light" or "dark")."""
+    if mode != "auto" and mode not in MODES:
+        raise ValueError(f'mode must be "auto", "light" or "dark", not {mode!r}')
+    return mode
+
+
+def theme_payload(theme: Theme) -> dict:
+    """What the frontend needs for ``theme``: only the changed variables."""
+    if theme is DEFAULT_THEME or not (theme.overrides["light"] or theme.overrides["dark"]):
+        return None
+    return theme.overrides
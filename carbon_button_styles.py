@@ -3,80 +3,10 @@ Production-ready Carbon Button styles for your app
 Implements the exact design patterns from test_styled_carbon_buttons.py
 """
 
-from carbon_button import carbon_button as _carbon_button, CarbonIcons
+from briquette import carbon_button as _carbon_button, carbon_button_group, CarbonIcons
+from briquette.styles import inject_carbon_styles
 import streamlit as st
 
-# Inject custom CSS for the minimal grey style
-def inject_carbon_styles():
-    """
-    Inject CSS to achieve the minimal grey button style.
-    Call this once at the top of your app.
-    """
-    st.markdown("""
-    <style>
-    /* Your custom light mode colors */
-    button[data-testid="baseButton-secondary"] {
-        background-color: #e6e2e2 !important;
-        color: #1a1a1a !important;
-        border: 1px solid #cccccc !important;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1) !important;
-        transition: all 0.15s ease !important;
-    }
-    
-    button[data-testid="baseButton-secondary"]:hover {
-        background-color: #f5f5f5 !important;
-        color: #000000 !important;
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15) !important;
-        border-color: #b0b0b0 !important;
-    }
-    
-    button[data-testid="baseButton-secondary"]:active {
-        background-color: #50e4e0 !important;  /* Teal accent on click */
-        color: #ffffff !important;
-        transform: translateY(0) !important;
-        box-shadow: inset 0 2px 4px rgba(0,0,0,0.1) !important;
-        border-color: #404040 !important;
-    }
-    
-    /* Remove focus outline (the blue border) */
-    button[data-testid="baseButton-secondary"]:focus {
-        outline: none !important;
-        border: none !important;
-        box-shadow: 0 1px 2px rgba(0,0,0,0.05) !important;
-    }
-    
-    /* Ghost/outlined style */
-    button[data-testid="baseButton-ghost"] {
-        background-color: transparent !important;
-        color: #393939 !important;
-        border: 1px solid #e0e0e0 !important;  /* Light grey border */
-        transition: all 0.2s ease !important;
-    }
-    
-    button[data-testid="baseButton-ghost"]:hover {
-        background-color: #fafafa !important;  /* Light fill on hover */
-        color: #161616 !important;
-        border-color: #d0d0d0 !important;
-    }
-    
-    button[data-testid="baseButton-ghost"]:active {
-        background-color: #e0e0e0 !important;
-        color: #161616 !important;
-    }
-    
-    button[data-testid="baseButton-ghost"]:focus {
-        outline: none !important;
-        border-color: #e0e0e0 !important;
-    }
-    
-    /* Ensure icons stay visible */
-    .carbon-button-icon svg {
-        fill: currentColor !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
 def minimal_button(label, icon, key, **kwargs):
     """
     Create a minimal style button (grey background, black icon)
@@ -150,28 +80,40 @@ def icon_button(icon, key, style="minimal", tooltip=None, **kwargs):
     
     return button_func("", icon, key, **kwargs)
 
+# Button types behind each named style
+_STYLE_TYPES = {
+    "minimal": "secondary",
+    "outlined": "ghost",
+    "primary": "primary",
+    "danger": "danger"
+}
+
 # Pre-styled button groups for common use cases
-def create_toolbar(buttons, style="minimal"):
+def create_toolbar(buttons, style="minimal", key=None):
     """
     Create a horizontal toolbar of icon buttons
     
+    All buttons are drawn by a single component, so the toolbar costs one
+    iframe however many buttons it holds.
+    
     Args:
         buttons: List of (icon, key, tooltip) tuples
         style: Button style to use
+        key: Optional key for the toolbar as a whole
     
     Returns:
         Dict of button keys and their clicked state
     """
-    results = {}
-    cols = st.columns(len(buttons))
-    
-    for i, (icon, key, tooltip) in enumerate(buttons):
-        with cols[i]:
-            results[key] = icon_button(icon, key, style=style, tooltip=tooltip)
+    clicked = carbon_button_group(
+        [{"icon": icon, "key": btn_key, "help": tooltip}
+         for icon, btn_key, tooltip in buttons],
+        key=key,
+        button_type=_STYLE_TYPES.get(style, "secondary"),
+    )
     
-    return results
+    return {btn_key: btn_key == clicked for _, btn_key, _ in buttons}
 
-def create_action_buttons(actions, style="minimal", use_container_width=False):
+def create_action_buttons(actions, style="minimal", use_container_width=False, key=None):
     """
     Create a set of action buttons with labels
     
@@ -179,27 +121,21 @@ def create_action_buttons(actions, style="minimal", use_container_width=False):
         actions: List of (label, icon, key) tuples
         style: Button style to use
         use_container_width: Whether buttons should fill container
+        key: Optional key for the button set as a whole
     
     Returns:
         Dict of button keys and their clicked state
     """
-    results = {}
-    button_func = {
-        "minimal": minimal_button,
-        "outlined": outlined_button,
-        "primary": primary_button,
-        "danger": danger_button
-    }.get(style, minimal_button)
-    
-    for label, icon, key in actions:
-        results[key] = button_func(
-            label, 
-            icon, 
-            key, 
-            use_container_width=use_container_width
-        )
+    clicked = carbon_button_group(
+        [{"label": label, "icon": icon, "key": btn_key}
+         for label, icon, btn_key in actions],
+        key=key,
+        button_type=_STYLE_TYPES.get(style, "secondary"),
+        use_container_width=use_container_width,
+        vertical=True,
+    )
     
-    return results
+    return {btn_key: btn_key == clicked for _, _, btn_key in actions}
 
 # Example usage
 if __name__ == "__main__":
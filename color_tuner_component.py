@@ -5,7 +5,8 @@ This version works with the actual React component
 
 import streamlit as st
 import json
-from carbon_button import carbon_button_raw, CarbonIcons
+from briquette import carbon_button_raw, CarbonIcons
+from briquette.palette import PRESETS, button_colors
 
 st.set_page_config(page_title="Carbon Button Component Color Tuner", page_icon="🎨", layout="wide")
 
@@ -14,17 +15,7 @@ st.markdown("Fine-tune your button colors with live preview using the actual com
 
 # Initialize session state for colors
 if 'color_scheme' not in st.session_state:
-    st.session_state.color_scheme = {
-        "rest_bg": "#e0e0e0",
-        "rest_text": "#1a1a1a",
-        "rest_border": "#cccccc",
-        "hover_bg": "#f5f5f5",
-        "hover_text": "#000000",
-        "hover_border": "#b0b0b0",
-        "active_bg": "#c0c0c0",
-        "active_text": "#000000",
-        "active_border": "#999999",
-    }
+    st.session_state.color_scheme = button_colors(PRESETS["default"]["light"])
 
 # Create two columns - controls and preview
 control_col, preview_col = st.columns([1, 1])
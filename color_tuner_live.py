@@ -5,7 +5,8 @@ Real-time color updates!
 
 import streamlit as st
 import json
-from carbon_button import carbon_button, CarbonIcons
+from briquette import carbon_button, CarbonIcons
+from briquette.palette import BUTTON_PRESETS
 
 st.set_page_config(page_title="Carbon Button Live Color Tuner", page_icon="🎨", layout="wide")
 
@@ -14,17 +15,7 @@ st.markdown("Adjust colors and see changes in real-time!")
 
 # Initialize session state for colors
 if 'colors' not in st.session_state:
-    st.session_state.colors = {
-        "rest_bg": "#e0e0e0",
-        "rest_text": "#1a1a1a",
-        "rest_border": "#cccccc",
-        "hover_bg": "#f5f5f5",
-        "hover_text": "#000000",
-        "hover_border": "#b0b0b0",
-        "active_bg": "#606060",  # Much darker for click
-        "active_text": "#ffffff",
-        "active_border": "#404040",
-    }
+    st.session_state.colors = dict(BUTTON_PRESETS["default"])
 
 # Create two columns - controls and preview
 control_col, preview_col = st.columns([1, 1])
@@ -179,6 +170,7 @@ with col2:
     
     python_code = f"""# Use these colors in your app:
 from carbon_button import carbon_button, CarbonIcons
+from briquette.palette import BUTTON_PRESETS
 
 # Define your custom colors
 my_colors = {json.dumps(st.session_state.colors, indent=4)}
@@ -211,62 +203,22 @@ col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     if st.button("High Contrast"):
-        st.session_state.colors = {
-            "rest_bg": "#d0d0d0",
-            "rest_text": "#000000",
-            "rest_border": "#a0a0a0",
-            "hover_bg": "#e8e8e8",
-            "hover_text": "#000000",
-            "hover_border": "#808080",
-            "active_bg": "#303030",
-            "active_text": "#ffffff",
-            "active_border": "#000000",
-        }
+        st.session_state.colors = dict(BUTTON_PRESETS["high_contrast"])
         st.rerun()
 
 with col2:
     if st.button("Subtle"):
-        st.session_state.colors = {
-            "rest_bg": "#f8f8f8",
-            "rest_text": "#333333",
-            "rest_border": "#e8e8e8",
-            "hover_bg": "#ffffff",
-            "hover_text": "#000000",
-            "hover_border": "#d0d0d0",
-            "active_bg": "#e0e0e0",
-            "active_text": "#000000",
-            "active_border": "#c0c0c0",
-        }
+        st.session_state.colors = dict(BUTTON_PRESETS["subtle"])
         st.rerun()
 
 with col3:
     if st.button("Dark Theme"):
-        st.session_state.colors = {
-            "rest_bg": "#3a3a3a",
-            "rest_text": "#e0e0e0",
-            "rest_border": "#4a4a4a",
-            "hover_bg": "#4a4a4a",
-            "hover_text": "#ffffff",
-            "hover_border": "#5a5a5a",
-            "active_bg": "#1a1a1a",
-            "active_text": "#ffffff",
-            "active_border": "#0a0a0a",
-        }
+        st.session_state.colors = dict(BUTTON_PRESETS["dark"])
         st.rerun()
 
 with col4:
     if st.button("Reset Default"):
-        st.session_state.colors = {
-            "rest_bg": "#e0e0e0",
-            "rest_text": "#1a1a1a",
-            "rest_border": "#cccccc",
-            "hover_bg": "#f5f5f5",
-            "hover_text": "#000000",
-            "hover_border": "#b0b0b0",
-            "active_bg": "#606060",
-            "active_text": "#ffffff",
-            "active_border": "#404040",
-        }
+        st.session_state.colors = dict(BUTTON_PRESETS["default"])
         st.rerun()
 
 st.caption("💡 Colors update instantly as you change them!")
\ No newline at end of file
@@ -3,7 +3,8 @@ Debug SVG passing between Python and React
 """
 
 import streamlit as st
-from carbon_button import carbon_button, CarbonIcons
+from briquette import carbon_button, CarbonIcons
+from briquette.svg import normalize_svg
 import json
 
 st.set_page_config(page_title="SVG Debug", page_icon="🔍")
@@ -35,6 +36,8 @@ st.write("3. Simple SVG:")
 simple_svg = '<svg viewBox="0 0 32 32"><rect x="10" y="10" width="12" height="12" fill="currentColor"/></svg>'
 if carbon_button("Test 3", simple_svg, key="test3"):
     st.success("Clicked!")
+st.write("What the component receives after normalization:")
+st.code(normalize_svg(simple_svg))
 
 # Test 4: No icon
 st.write("4. No icon (empty string):")
@@ -52,5 +55,6 @@ st.info("""
 **Check the browser console for:**
 - "Carbon Button Debug:" messages
 - Look at `iconPreview` to see what the React component receives
+  (built-in icons arrive as `iconRef` instead of SVG markup)
 - Check if the SVG string is intact or corrupted
 """)
\ No newline at end of file
@@ -0,0 +1,72 @@
+import React from "react"
+import { buttonClassName } from "./buttonStyles"
+import { CARBON_ICONS, iconSymbolId } from "./icons"
+
+export interface ButtonFaceProps {
+  label?: string
+  icon?: string
+  iconRef?: string
+  buttonType?: string
+  disabled?: boolean
+  busy?: boolean
+  useContainerWidth?: boolean
+  title?: string
+  onClick: () => void
+}
+
+/**
+ * A single Carbon-styled button. Shared by the single button and the
+ * multi-button components so every variant renders identically. Colors
+ * come from the theme variables set on the component's root element.
+ */
+const ButtonFace = (props: ButtonFaceProps) => {
+  const { label, icon, iconRef, useContainerWidth, title, onClick } = props
+  const buttonType = props.buttonType || "primary"
+  // A busy button can't be clicked again until its work is done
+  const busy = !!props.busy
+  const disabled = props.disabled || busy
+
+  // Built-in icons arrive by name and are drawn from the sprite
+  const hasSpriteIcon = !!iconRef && iconRef in CARBON_ICONS
+  const hasIcon = hasSpriteIcon || (!!icon && icon.trim() !== "")
+  const hasLabel = !!label && label.trim() !== ""
+  const isIconOnly = hasIcon && !hasLabel
+
+  const className = buttonClassName({
+    buttonType,
+    useContainerWidth,
+    isIconOnly,
+    hasIcon,
+    hasLabel,
+  })
+
+  return (
+    <button
+      className={className}
+      onClick={onClick}
+      disabled={disabled}
+      aria-busy={busy}
+      title={title}
+    >
+      <div className="carbon-button-content">
+        {busy && <span className="carbon-button-spinner" aria-hidden="true" />}
+        {!busy && hasSpriteIcon && (
+          <span className="carbon-button-icon">
+            <svg aria-hidden="true">
+              <use href={`#${iconSymbolId(iconRef as string)}`} />
+            </svg>
+          </span>
+        )}
+        {!busy && hasIcon && !hasSpriteIcon && (
+          <span
+            className="carbon-button-icon"
+            dangerouslySetInnerHTML={{ __html: icon as string }}
+          />
+        )}
+        {hasLabel && <span>{label}</span>}
+      </div>
+    </button>
+  )
+}
+
+export default ButtonFace
@@ -0,0 +1,130 @@
+import React from "react"
+import {
+  ArrowTable,
+  Streamlit,
+  StreamlitComponentBase,
+} from "streamlit-component-lib"
+import ButtonFace from "./ButtonFace"
+import { isDarkMode, themeProps } from "./buttonStyles"
+import { ClickEvents } from "./clickEvents"
+import { ScrollTracker, visibleRows } from "./windowing"
+
+interface ActionSpec {
+  name: string
+  icon?: string
+  iconRef?: string
+  label?: string
+  buttonType?: string
+}
+
+interface State {
+  scrollTop: number
+}
+
+const formatCell = (content: any): string => {
+  if (content === null || content === undefined) {
+    return ""
+  }
+  if (content instanceof Date) {
+    return content.toLocaleString()
+  }
+  return String(content)
+}
+
+/**
+ * A DataFrame rendered as a table with a column of per-row action buttons.
+ *
+ * The rows arrive through Streamlit's Arrow serialization and the actions
+ * are sent once, so N rows x M actions cost one payload and one iframe.
+ * Like the grid, only rows in the viewport are mounted.
+ */
+class CarbonActionTable extends StreamlitComponentBase<State> {
+  public state = { scrollTop: 0 }
+  private events = new ClickEvents()
+  private scroll = new ScrollTracker(scrollTop => this.setState({ scrollTop }))
+
+  public componentWillUnmount() {
+    this.scroll.cancel()
+  }
+
+  public render = (): React.ReactNode => {
+    const { actions, buttonType, themeVars, height, rowHeight } = this.props.args
+    const data: ArrowTable = this.props.args.data
+    const actionSpecs: ActionSpec[] = actions || []
+
+    const headerRows = data.headerRows
+    const headerColumns = data.headerColumns
+    const numRows = data.dataRows
+    const numColumns = data.dataColumns
+
+    const gridTemplateColumns = `repeat(${numColumns}, minmax(0, 1fr)) auto`
+
+    const header: React.ReactNode[] = []
+    for (let column = 0; column < numColumns; column++) {
+      const cell = data.getCell(headerRows - 1, headerColumns + column)
+      header.push(
+        <div key={column} className="carbon-action-table-heading">
+          {formatCell(cell.content)}
+        </div>
+      )
+    }
+
+    const { firstRow, lastRow } = visibleRows(this.state.scrollTop, height, rowHeight, numRows)
+
+    const rows: React.ReactNode[] = []
+    for (let row = firstRow; row < lastRow; row++) {
+      const cells: React.ReactNode[] = []
+      for (let column = 0; column < numColumns; column++) {
+        const cell = data.getCell(headerRows + row, headerColumns + column)
+        cells.push(
+          <div key={column} className="carbon-action-table-cell">
+            {formatCell(cell.content)}
+          </div>
+        )
+      }
+      rows.push(
+        <div
+          key={row}
+          className="carbon-action-table-row"
+          style={{ top: row * rowHeight, height: rowHeight, gridTemplateColumns }}
+        >
+          {cells}
+          <div className="carbon-action-table-actions">
+            {actionSpecs.map(action => (
+              <ButtonFace
+                key={action.name}
+                label={action.label}
+                icon={action.icon}
+                iconRef={action.iconRef}
+                buttonType={action.buttonType || buttonType}
+                title={action.name}
+                onClick={() => this.onClicked(row, action.name)}
+              />
+            ))}
+          </div>
+        </div>
+      )
+    }
+
+    const theme = themeProps(themeVars, isDarkMode(this.props.args.mode, this.props.theme))
+    return (
+      <div className={`${theme.className} carbon-action-table`} style={theme.style}>
+        <div className="carbon-action-table-header" style={{ gridTemplateColumns }}>
+          {header}
+          <div />
+        </div>
+        <div className="carbon-button-grid" style={{ height }} onScroll={this.scroll.onScroll}>
+          <div className="carbon-button-grid-spacer" style={{ height: numRows * rowHeight }}>
+            {rows}
+          </div>
+        </div>
+      </div>
+    )
+  }
+
+  private onClicked = (row: number, action: string): void => {
+    Streamlit.setComponentValue({ row, action, ...this.events.next() })
+  }
+}
+
+export default CarbonActionTable
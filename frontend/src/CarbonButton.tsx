@@ -1,352 +1,186 @@
-import React, { useEffect } from "react"
+import React from "react"
 import {
   Streamlit,
   StreamlitComponentBase,
-  withStreamlitConnection,
 } from "streamlit-component-lib"
+import ButtonFace from "./ButtonFace"
+import { isDarkMode, themeProps } from "./buttonStyles"
+import { ClickEvent, ClickEvents, ClickThrottle, isAcknowledged } from "./clickEvents"
+import { Telemetry, TelemetryReport } from "./telemetry"
+
+// Give up on an acknowledgement that never comes (e.g. the script raised)
+const PENDING_TIMEOUT_MS = 30000
+
+// A confirm prompt nobody answers goes back to the plain button
+const CONFIRM_TIMEOUT_MS = 5000
 
 interface State {
-  numClicks: number
-  isDarkMode: boolean
+  pending: boolean
+  confirming: boolean
 }
 
 class CarbonButton extends StreamlitComponentBase<State> {
-  public state = { numClicks: 0, isDarkMode: false }
+  public state = { pending: false, confirming: false }
+  private events = new ClickEvents()
+  // Telemetry reports are numbered apart from clicks
+  private reports = new ClickEvents()
+  private throttle = new ClickThrottle(count => {
+    const event = this.events.next()
+    this.awaitingAck = event
+    if (this.telemetry) {
+      this.telemetry.clickSent()
+      Streamlit.setComponentValue({ ...event, count, telemetry: this.telemetry.takeBatch() })
+    } else {
+      Streamlit.setComponentValue({ ...event, count })
+    }
+  })
+  // Only measured when Python turns telemetry on
+  private telemetry: Telemetry | null = this.props.args.telemetry ? new Telemetry() : null
+  // The last click sent, until a rerun acknowledges it
+  private awaitingAck: ClickEvent | null = null
+  private pendingTimer: number | null = null
+  private confirmTimer: number | null = null
 
   public componentDidMount() {
-    // Add global styles for SVG icons
-    const style = document.createElement('style')
-    style.textContent = `
-      .carbon-button-icon {
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        width: 16px;
-        height: 16px;
-        flex-shrink: 0;
-      }
-      .carbon-button-icon svg {
-        width: 100%;
-        height: 100%;
-        fill: currentColor;
-      }
-      .carbon-button-content {
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        gap: 0.5rem;
-        width: 100%;
+    super.componentDidMount()
+    if (this.telemetry) {
+      this.telemetry.mounted(this.sendReport)
+    }
+  }
+
+  public componentDidUpdate() {
+    super.componentDidUpdate()
+    const { ackEvent } = this.props.args
+    if (this.awaitingAck && isAcknowledged(ackEvent, this.awaitingAck)) {
+      if (this.telemetry) {
+        this.telemetry.clickAcknowledged()
       }
-      .carbon-button-icon-only {
-        padding: 0.75rem !important;
+      if (this.state.pending) {
+        this.clearPending()
+      } else {
+        this.awaitingAck = null
       }
-    `
-    document.head.appendChild(style)
-    
-    // Check for dark mode
-    const checkDarkMode = () => {
-      const isDark = window.matchMedia && window.matchMedia('(prefers-color-scheme: dark)').matches
-      this.setState({ isDarkMode: isDark })
-    }
-    
-    // Initial check
-    checkDarkMode()
-    
-    // Listen for changes
-    if (window.matchMedia) {
-      window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', checkDarkMode)
+      // Otherwise the latency of the last click would never be sent
+      this.sendReport()
     }
   }
-  
+
   public componentWillUnmount() {
-    // Clean up listener
-    if (window.matchMedia) {
-      const checkDarkMode = () => {
-        const isDark = window.matchMedia && window.matchMedia('(prefers-color-scheme: dark)').matches
-        this.setState({ isDarkMode: isDark })
-      }
-      window.matchMedia('(prefers-color-scheme: dark)').removeEventListener('change', checkDarkMode)
+    this.throttle.flush()
+    if (this.pendingTimer !== null) {
+      window.clearTimeout(this.pendingTimer)
+    }
+    if (this.confirmTimer !== null) {
+      window.clearTimeout(this.confirmTimer)
     }
   }
 
   public render = (): React.ReactNode => {
-    const { label, icon, buttonType, disabled, useContainerWidth, colors } = this.props.args
-    
-    // Debug: Log what we're receiving
-    console.log("Carbon Button Debug:", { 
-      label, 
-      hasIcon: !!icon,
-      iconLength: icon?.length,
-      iconPreview: icon?.substring(0, 100), 
-      buttonType,
-      allArgs: this.props.args 
-    })
-    
-    // Extra debug - check if icon contains SVG
-    if (icon) {
-      console.log("Icon contains <svg>:", icon.includes('<svg'))
-      console.log("Icon contains viewBox:", icon.includes('viewBox'))
-    }
-    
-    const hasIcon = icon && icon.trim() !== ''
-    const hasLabel = label && label.trim() !== ''
-    const isIconOnly = hasIcon && !hasLabel
+    const { label, icon, iconRef, buttonType, disabled, busy, useContainerWidth, themeVars } = this.props.args
 
-    // Adjust padding for visual balance
-    // When icon + text: more padding on right to balance the visual weight
-    // When icon only: equal padding
-    let padding = "0.75rem 1rem"
-    if (isIconOnly) {
-      padding = "0.75rem"
-    } else if (hasIcon && hasLabel) {
-      // Asymmetric padding: less on left (icon side), more on right
-      padding = "0.75rem 1.25rem 0.75rem 0.875rem"
+    if (this.telemetry) {
+      this.telemetry.rendered()
     }
 
-    const buttonStyle: React.CSSProperties = {
-      backgroundColor: this.getBackgroundColor(buttonType),
-      color: this.getTextColor(buttonType),
-      border: buttonType === "ghost" ? `1px solid ${this.getBorderColor(buttonType)}` : buttonType === "secondary" ? `1px solid ${this.getBorderColor(buttonType)}` : "none",
-      padding: padding,
-      fontSize: "14px",
-      fontWeight: 400,
-      borderRadius: 0,
-      cursor: disabled ? "not-allowed" : "pointer",
-      display: "inline-flex",
-      alignItems: "center",
-      justifyContent: "center",
-      width: useContainerWidth ? "100%" : "auto",
-      transition: "all 70ms cubic-bezier(0.2, 0, 0.38, 0.9)",
-      fontFamily: '"IBM Plex Sans", system-ui, -apple-system, sans-serif',
-      lineHeight: 1,
-      opacity: disabled ? 0.5 : 1,
-      boxShadow: buttonType === "secondary" ? "0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.05)" : "none",
-      outline: "none",
+    const theme = themeProps(themeVars, isDarkMode(this.props.args.mode, this.props.theme))
+    if (this.state.confirming) {
+      // Nothing has been sent to Python yet; only "confirm" sends the click
+      return (
+        <div className={`${theme.className} carbon-button-confirm`} style={theme.style}>
+          <ButtonFace
+            label={this.props.args.confirm}
+            buttonType={buttonType}
+            useContainerWidth={useContainerWidth}
+            onClick={this.onConfirmed}
+          />
+          <ButtonFace
+            label="Cancel"
+            buttonType="ghost"
+            onClick={this.cancelConfirm}
+          />
+        </div>
+      )
     }
 
     return (
-      <button
-        style={buttonStyle}
-        className={isIconOnly ? "carbon-button-icon-only" : ""}
-        onClick={this.onClicked}
-        disabled={disabled}
-        onMouseEnter={(e) => this.handleHover(e, true)}
-        onMouseLeave={(e) => this.handleHover(e, false)}
-        onMouseDown={this.handleMouseDown}
-        onMouseUp={this.handleMouseUp}
-      >
-        <div className="carbon-button-content">
-          {hasIcon && (
-            <span 
-              className="carbon-button-icon"
-              dangerouslySetInnerHTML={{ __html: icon }} 
-            />
-          )}
-          {hasLabel && <span>{label}</span>}
-        </div>
-      </button>
+      <div className={`${theme.className} carbon-button-root`} style={theme.style}>
+        <ButtonFace
+          label={label}
+          icon={icon}
+          iconRef={iconRef}
+          buttonType={buttonType}
+          disabled={disabled}
+          busy={busy || this.state.pending}
+          useContainerWidth={useContainerWidth}
+          onClick={this.onClicked}
+        />
+      </div>
     )
   }
 
-  private getBackgroundColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.rest_bg && type === "secondary") {
-      return this.props.args.colors.rest_bg
-    }
-    
-    // Different colors for light/dark mode
-    const lightColors: { [key: string]: string } = {
-      primary: "#0f62fe",
-      secondary: "#e6e2e2",  // Your custom light mode color
-      danger: "#da1e28",
-      ghost: "transparent",
-    }
-    
-    const darkColors: { [key: string]: string } = {
-      primary: "#0f62fe",
-      secondary: "#ecdcdc",  // Your custom dark mode color
-      danger: "#da1e28",
-      ghost: "transparent",
+  private onClicked = (): void => {
+    if (this.props.args.confirm) {
+      this.setState({ confirming: true })
+      this.confirmTimer = window.setTimeout(this.cancelConfirm, CONFIRM_TIMEOUT_MS)
+      return
     }
-    
-    const colors = this.state.isDarkMode ? darkColors : lightColors
-    return colors[type] || colors.primary
+    this.sendClick()
   }
 
-  private getTextColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.rest_text && type === "secondary") {
-      return this.props.args.colors.rest_text
-    }
-    
-    const colors: { [key: string]: string } = {
-      primary: "#ffffff",
-      secondary: "#1a1a1a",  // Almost black for maximum contrast
-      danger: "#ffffff",
-      ghost: "#262626",
-    }
-    return colors[type] || colors.primary
+  private onConfirmed = (): void => {
+    this.cancelConfirm()
+    this.sendClick()
   }
 
-  private getBorderColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.rest_border && type === "secondary") {
-      return this.props.args.colors.rest_border
-    }
-    
-    const lightColors: { [key: string]: string } = {
-      primary: "#0f62fe",
-      secondary: "#cccccc",
-      danger: "#da1e28",
-      ghost: "transparent",
+  private cancelConfirm = (): void => {
+    if (this.confirmTimer !== null) {
+      window.clearTimeout(this.confirmTimer)
+      this.confirmTimer = null
     }
-    
-    const darkColors: { [key: string]: string } = {
-      primary: "#0f62fe",
-      secondary: "#404040",  // Your dark mode border
-      danger: "#da1e28",
-      ghost: "transparent",
-    }
-    
-    const colors = this.state.isDarkMode ? darkColors : lightColors
-    return colors[type] || colors.primary
+    this.setState({ confirming: false })
   }
 
-  private getHoverBackgroundColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.hover_bg && type === "secondary") {
-      return this.props.args.colors.hover_bg
-    }
-    
-    const lightColors: { [key: string]: string } = {
-      primary: "#0043ce",
-      secondary: "#f5f5f5",  // Light mode hover
-      danger: "#ba1b23",
-      ghost: "#e0e0e0",
-    }
-    
-    const darkColors: { [key: string]: string } = {
-      primary: "#0043ce",
-      secondary: "#f6f4f4",  // Dark mode hover
-      danger: "#ba1b23",
-      ghost: "#e0e0e0",
-    }
-    
-    const colors = this.state.isDarkMode ? darkColors : lightColors
-    return colors[type] || colors.primary
-  }
-  
-  private getHoverTextColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.hover_text && type === "secondary") {
-      return this.props.args.colors.hover_text
-    }
-    
-    return this.getTextColor(type)
-  }
-  
-  private getHoverBorderColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.hover_border && type === "secondary") {
-      return this.props.args.colors.hover_border
-    }
-    
-    return this.getBorderColor(type)
-  }
-  
-  private getActiveBackgroundColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.active_bg && type === "secondary") {
-      return this.props.args.colors.active_bg
-    }
-    
-    const lightColors: { [key: string]: string } = {
-      primary: "#002d9c",
-      secondary: "#50e4e0",  // Light mode teal
-      danger: "#750e13",
-      ghost: "#c0c0c0",
-    }
-    
-    const darkColors: { [key: string]: string } = {
-      primary: "#002d9c",
-      secondary: "#67cccc",  // Dark mode teal
-      danger: "#750e13",
-      ghost: "#c0c0c0",
-    }
-    
-    const colors = this.state.isDarkMode ? darkColors : lightColors
-    return colors[type] || colors.primary
-  }
-  
-  private getActiveTextColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.active_text && type === "secondary") {
-      return this.props.args.colors.active_text
-    }
-    
-    // Dark mode uses black text on teal
-    if (this.state.isDarkMode && type === "secondary") {
-      return "#000000"
-    }
-    
-    // Light mode uses white text on teal
-    if (!this.state.isDarkMode && type === "secondary") {
-      return "#ffffff"
-    }
-    
-    return this.getTextColor(type)
-  }
-  
-  private getActiveBorderColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.active_border && type === "secondary") {
-      return this.props.args.colors.active_border
+  /** Send what telemetry has measured, unless a click will carry it. */
+  private sendReport = (): void => {
+    if (this.telemetry && !this.awaitingAck) {
+      const report: TelemetryReport = {
+        report: this.reports.next(),
+        telemetry: this.telemetry.takeBatch(),
+      }
+      Streamlit.setComponentValue(report)
     }
-    
-    return this.getBorderColor(type)
   }
 
-  private handleHover = (e: React.MouseEvent<HTMLButtonElement>, isHover: boolean) => {
-    const button = e.currentTarget
-    const type = this.props.args.buttonType || "primary"
-    
-    if (isHover) {
-      button.style.backgroundColor = this.getHoverBackgroundColor(type)
-      button.style.color = this.getHoverTextColor(type)
-      button.style.borderColor = this.getHoverBorderColor(type)
-      button.style.transform = "translateY(-1px)"
-      button.style.boxShadow = "0 2px 6px rgba(0, 0, 0, 0.15)"
-    } else {
-      button.style.backgroundColor = this.getBackgroundColor(type)
-      button.style.color = this.getTextColor(type)
-      button.style.borderColor = this.getBorderColor(type)
-      button.style.transform = "translateY(0)"
-      button.style.boxShadow = type === "secondary" ? "0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.05)" : "none"
+  private sendClick(): void {
+    const { throttleMs, coalesce, pendingFeedback } = this.props.args
+    const previous = this.awaitingAck
+    if (!this.throttle.click(throttleMs, coalesce)) {
+      // Dropped by the throttle, so there is no rerun to wait for
+      return
+    }
+    if (pendingFeedback) {
+      if (this.awaitingAck === previous) {
+        // Coalesced clicks go out when the window closes; until then an
+        // earlier click's acknowledgement mustn't end the spinner
+        this.awaitingAck = null
+      }
+      // Show the spinner now rather than when the rerun finishes
+      if (this.pendingTimer !== null) {
+        window.clearTimeout(this.pendingTimer)
+      }
+      this.setState({ pending: true })
+      this.pendingTimer = window.setTimeout(this.clearPending, PENDING_TIMEOUT_MS)
     }
   }
-  
-  private handleMouseDown = (e: React.MouseEvent<HTMLButtonElement>) => {
-    const button = e.currentTarget
-    const type = this.props.args.buttonType || "primary"
-    
-    button.style.backgroundColor = this.getActiveBackgroundColor(type)
-    button.style.color = this.getActiveTextColor(type)
-    button.style.borderColor = this.getActiveBorderColor(type)
-    button.style.transform = "translateY(0)"
-    button.style.boxShadow = "inset 0 1px 2px rgba(0, 0, 0, 0.2)"
-  }
-  
-  private handleMouseUp = (e: React.MouseEvent<HTMLButtonElement>) => {
-    // Return to hover state since mouse is still over the button
-    this.handleHover(e, true)
-  }
 
-  private onClicked = (): void => {
-    this.setState(
-      prevState => ({ numClicks: prevState.numClicks + 1 }),
-      () => Streamlit.setComponentValue(this.state.numClicks)
-    )
+  private clearPending = (): void => {
+    if (this.pendingTimer !== null) {
+      window.clearTimeout(this.pendingTimer)
+      this.pendingTimer = null
+    }
+    this.awaitingAck = null
+    this.setState({ pending: false })
   }
 }
 
-export default withStreamlitConnection(CarbonButton)
\ No newline at end of file
+export default CarbonButton
\ No newline at end of file
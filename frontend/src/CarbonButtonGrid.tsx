@@ -0,0 +1,117 @@
+import React from "react"
+import {
+  Streamlit,
+  StreamlitComponentBase,
+} from "streamlit-component-lib"
+import ButtonFace from "./ButtonFace"
+import { isDarkMode, themeProps } from "./buttonStyles"
+import { ClickEvents } from "./clickEvents"
+import { ScrollTracker, visibleRows } from "./windowing"
+
+interface IconPayload {
+  icon?: string
+  iconRef?: string
+}
+
+interface State {
+  scrollTop: number
+}
+
+/**
+ * A scrollable grid of buttons that only mounts the rows in view.
+ *
+ * Cells arrive column-wise (``labels``, ``iconIds`` into a de-duplicated
+ * ``icons`` table of icon payloads, ``disabledCells``) so tens of thousands
+ * of buttons stay a compact payload, and the DOM only ever holds a
+ * screenful of them.
+ */
+class CarbonButtonGrid extends StreamlitComponentBase<State> {
+  public state = { scrollTop: 0 }
+  private events = new ClickEvents()
+
+  private scroll = new ScrollTracker(scrollTop => this.setState({ scrollTop }))
+  private disabledLookup: Set<number> = new Set()
+  private disabledSource: number[] | null = null
+
+  public componentWillUnmount() {
+    this.scroll.cancel()
+  }
+
+  public render = (): React.ReactNode => {
+    const { labels, icons, iconIds, buttonType, disabled, themeVars, columns, height, rowHeight, gap } = this.props.args
+    const cellLabels: string[] = labels || []
+    const numColumns: number = Math.max(1, columns || 1)
+    const numRows = Math.ceil(cellLabels.length / numColumns)
+    const disabledCells = this.getDisabledCells()
+
+    const { firstRow, lastRow } = visibleRows(this.state.scrollTop, height, rowHeight, numRows)
+
+    const rows: React.ReactNode[] = []
+    for (let row = firstRow; row < lastRow; row++) {
+      const cells: React.ReactNode[] = []
+      for (let column = 0; column < numColumns; column++) {
+        const index = row * numColumns + column
+        if (index >= cellLabels.length) {
+          break
+        }
+        const iconId = iconIds ? iconIds[index] : -1
+        const cellIcon: IconPayload = iconId >= 0 ? icons[iconId] : {}
+        cells.push(
+          <ButtonFace
+            key={index}
+            label={cellLabels[index]}
+            icon={cellIcon.icon}
+            iconRef={cellIcon.iconRef}
+            buttonType={buttonType}
+            disabled={disabled || disabledCells.has(index)}
+            useContainerWidth={true}
+            onClick={() => this.onClicked(index)}
+          />
+        )
+      }
+      rows.push(
+        <div
+          key={row}
+          className="carbon-button-grid-row"
+          style={{
+            top: row * rowHeight,
+            height: rowHeight,
+            gap: gap,
+            gridTemplateColumns: `repeat(${numColumns}, minmax(0, 1fr))`,
+          }}
+        >
+          {cells}
+        </div>
+      )
+    }
+
+    const theme = themeProps(themeVars, isDarkMode(this.props.args.mode, this.props.theme))
+    return (
+      <div
+        className={`${theme.className} carbon-button-grid`}
+        style={{ ...theme.style, height }}
+        onScroll={this.scroll.onScroll}
+      >
+        <div className="carbon-button-grid-spacer" style={{ height: numRows * rowHeight }}>
+          {rows}
+        </div>
+      </div>
+    )
+  }
+
+  private getDisabledCells = (): Set<number> => {
+    // Rebuild the lookup only when Python sends a new list
+    const source: number[] | null = this.props.args.disabledCells || null
+    if (source !== this.disabledSource) {
+      this.disabledSource = source
+      this.disabledLookup = new Set(source || [])
+    }
+    return this.disabledLookup
+  }
+
+  private onClicked = (index: number): void => {
+    Streamlit.setComponentValue({ index, ...this.events.next() })
+  }
+}
+
+export default CarbonButtonGrid
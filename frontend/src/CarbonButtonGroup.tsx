@@ -0,0 +1,63 @@
+import React from "react"
+import {
+  Streamlit,
+  StreamlitComponentBase,
+} from "streamlit-component-lib"
+import ButtonFace from "./ButtonFace"
+import { isDarkMode, themeProps } from "./buttonStyles"
+import { ClickEvents } from "./clickEvents"
+
+interface ButtonSpec {
+  key: string
+  label?: string
+  icon?: string
+  iconRef?: string
+  buttonType?: string
+  disabled?: boolean
+  help?: string
+}
+
+/**
+ * Renders a whole row (or column) of buttons from one component instance,
+ * so N buttons cost one iframe and one bundle parse instead of N.
+ */
+class CarbonButtonGroup extends StreamlitComponentBase {
+  private events = new ClickEvents()
+
+  public render = (): React.ReactNode => {
+    const { buttons, buttonType, disabled, useContainerWidth, themeVars, vertical, gap } = this.props.args
+    const specs: ButtonSpec[] = buttons || []
+
+    const theme = themeProps(themeVars, isDarkMode(this.props.args.mode, this.props.theme))
+    const classNames = [theme.className, "carbon-button-group"]
+    if (vertical) {
+      classNames.push("carbon-button-group-vertical")
+    } else if (useContainerWidth) {
+      classNames.push("carbon-button-group-fill")
+    }
+
+    return (
+      <div className={classNames.join(" ")} style={{ ...theme.style, gap: gap || "0.5rem" }}>
+        {specs.map((spec, index) => (
+          <ButtonFace
+            key={spec.key}
+            label={spec.label}
+            icon={spec.icon}
+            iconRef={spec.iconRef}
+            buttonType={spec.buttonType || buttonType}
+            disabled={disabled || spec.disabled}
+            useContainerWidth={vertical && useContainerWidth}
+            title={spec.help}
+            onClick={() => this.onClicked(index, spec.key)}
+          />
+        ))}
+      </div>
+    )
+  }
+
+  private onClicked = (index: number, key: string): void => {
+    Streamlit.setComponentValue({ index, key, ...this.events.next() })
+  }
+}
+
+export default CarbonButtonGroup
@@ -0,0 +1,206 @@
+import React from "react"
+import {
+  Streamlit,
+  StreamlitComponentBase,
+} from "streamlit-component-lib"
+import ButtonFace from "./ButtonFace"
+import { ClickEvents } from "./clickEvents"
+
+type Palette = { [name: string]: string }
+
+interface State {
+  palette: Palette
+}
+
+const STATE_LABELS: { [state: string]: string } = {
+  page: "Page Background",
+  rest: "Rest State (Normal)",
+  hover: "Hover State",
+  click: "Click State (Active)",
+  disabled: "Disabled State",
+}
+
+const PART_LABELS: { [part: string]: string } = {
+  bg: "Background",
+  text: "Text/Icon",
+  border: "Border",
+}
+
+// Palette keys drawn into the preview's secondary-button variables
+const PREVIEW_STATES: { [state: string]: string } = { rest: "rest", hover: "hover", click: "active" }
+
+const PREVIEW_ICONS = ["HOME", "ADD", "COPY", "DELETE", "SEARCH", "FILTER"]
+
+/** ``<input type="color">`` only takes #rrggbb. */
+const toPickerValue = (color: string): string => {
+  const hex = (color || "").trim()
+  if (/^#[0-9a-f]{6}$/i.test(hex)) {
+    return hex
+  }
+  if (/^#[0-9a-f]{3}$/i.test(hex)) {
+    return "#" + hex.slice(1).split("").map(c => c + c).join("")
+  }
+  return "#000000"
+}
+
+/** Palette keys grouped by state, e.g. rest -> [rest_bg, rest_text]. */
+const groupFields = (palette: Palette): [string, string[]][] => {
+  const groups: [string, string[]][] = []
+  Object.keys(palette).forEach(name => {
+    const state = name.split("_")[0]
+    const group = groups.find(([existing]) => existing === state)
+    if (group) {
+      group[1].push(name)
+    } else {
+      groups.push([state, [name]])
+    }
+  })
+  return groups
+}
+
+/**
+ * Color pickers and preview buttons in one iframe.
+ *
+ * Every change restyles the preview immediately, in the browser. The
+ * palette is only sent to Python once the user has paused for
+ * ``debounceMs``, so tuning costs one rerun per pause instead of one per
+ * picker change.
+ */
+class CarbonColorTuner extends StreamlitComponentBase<State> {
+  public state = { palette: { ...this.props.args.palette } }
+  private events = new ClickEvents()
+  private syncTimer: number | null = null
+  // The palette Python last passed in, and the one we last sent it
+  private lastProp: string = JSON.stringify(this.props.args.palette)
+  private lastSent: string | null = null
+
+  public componentDidUpdate() {
+    super.componentDidUpdate()
+    const incoming = JSON.stringify(this.props.args.palette)
+    if (incoming === this.lastProp) {
+      return
+    }
+    this.lastProp = incoming
+    // A rerun echoing what we sent mustn't undo edits made since; any
+    // other new palette (a preset, a reset) replaces the local one
+    if (incoming !== this.lastSent) {
+      this.cancelSync()
+      this.setState({ palette: { ...this.props.args.palette } })
+    }
+  }
+
+  public componentWillUnmount() {
+    if (this.syncTimer !== null) {
+      this.cancelSync()
+      this.sync()
+    }
+  }
+
+  public render = (): React.ReactNode => {
+    const { palette } = this.state
+    const theme = this.props.theme
+
+    return (
+      <div
+        className="carbon-theme carbon-color-tuner"
+        style={{ color: theme ? theme.textColor : undefined, fontFamily: theme ? theme.font : undefined }}
+      >
+        <div className="carbon-color-tuner-controls">
+          {groupFields(palette).map(([state, names]) => (
+            <fieldset key={state} className="carbon-color-tuner-group">
+              <legend>{STATE_LABELS[state] || state}</legend>
+              {names.map(name => (
+                <label key={name} className="carbon-color-tuner-field">
+                  <input
+                    type="color"
+                    value={toPickerValue(palette[name])}
+                    onChange={e => this.onPicked(name, e.currentTarget.value)}
+                  />
+                  <span>{PART_LABELS[name.slice(state.length + 1)] || name}</span>
+                  <code>{palette[name]}</code>
+                </label>
+              ))}
+            </fieldset>
+          ))}
+        </div>
+        <div className="carbon-color-tuner-preview" style={this.previewStyle(palette)}>
+          <div className="carbon-color-tuner-row">
+            <ButtonFace label="Upload" iconRef="UPLOAD" buttonType="secondary" onClick={this.ignore} />
+            <ButtonFace label="Save" iconRef="SAVE" buttonType="secondary" onClick={this.ignore} />
+            <ButtonFace label="Settings" iconRef="SETTINGS" buttonType="secondary" onClick={this.ignore} />
+          </div>
+          <div className="carbon-color-tuner-row">
+            {PREVIEW_ICONS.map(icon => (
+              <ButtonFace key={icon} iconRef={icon} buttonType="secondary" onClick={this.ignore} />
+            ))}
+          </div>
+          <div className="carbon-color-tuner-row carbon-color-tuner-disabled" style={this.disabledStyle(palette)}>
+            <ButtonFace label="Disabled Button" iconRef="CLOSE" buttonType="secondary" disabled={true} onClick={this.ignore} />
+          </div>
+          <ButtonFace
+            label="Process Files"
+            iconRef="PLAY"
+            buttonType="secondary"
+            useContainerWidth={true}
+            onClick={this.ignore}
+          />
+        </div>
+      </div>
+    )
+  }
+
+  private previewStyle(palette: Palette): React.CSSProperties {
+    const style: { [name: string]: string } = {}
+    if (palette.page_bg) {
+      style.backgroundColor = palette.page_bg
+    }
+    Object.keys(PREVIEW_STATES).forEach(state => {
+      Object.keys(PART_LABELS).forEach(part => {
+        const color = palette[`${state}_${part}`]
+        if (color) {
+          style[`--cb-secondary-${PREVIEW_STATES[state]}-${part}`] = color
+        }
+      })
+    })
+    return style as React.CSSProperties
+  }
+
+  private disabledStyle(palette: Palette): React.CSSProperties {
+    // A disabled button is drawn with its rest colors
+    const style: { [name: string]: string } = {}
+    Object.keys(PART_LABELS).forEach(part => {
+      const color = palette[`disabled_${part}`]
+      if (color) {
+        style[`--cb-secondary-rest-${part}`] = color
+      }
+    })
+    return style as React.CSSProperties
+  }
+
+  private onPicked = (name: string, color: string): void => {
+    this.setState(state => ({ palette: { ...state.palette, [name]: color } }))
+    this.cancelSync()
+    this.syncTimer = window.setTimeout(() => {
+      this.syncTimer = null
+      this.sync()
+    }, this.props.args.debounceMs)
+  }
+
+  private sync(): void {
+    const palette = this.state.palette
+    this.lastSent = JSON.stringify(palette)
+    Streamlit.setComponentValue({ palette, ...this.events.next() })
+  }
+
+  private cancelSync(): void {
+    if (this.syncTimer !== null) {
+      window.clearTimeout(this.syncTimer)
+      this.syncTimer = null
+    }
+  }
+
+  // Preview buttons are only there to be looked at and hovered
+  private ignore = (): void => {}
+}
+
+export default CarbonColorTuner
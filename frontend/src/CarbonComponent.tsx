@@ -0,0 +1,31 @@
+import React from "react"
+import {
+  ComponentProps,
+  withStreamlitConnection,
+} from "streamlit-component-lib"
+import CarbonActionTable from "./CarbonActionTable"
+import CarbonButton from "./CarbonButton"
+import CarbonButtonGrid from "./CarbonButtonGrid"
+import CarbonButtonGroup from "./CarbonButtonGroup"
+import CarbonColorTuner from "./CarbonColorTuner"
+
+/**
+ * Every Python entry point shares one bundle; the ``variant`` argument
+ * selects which component the iframe renders.
+ */
+const CarbonComponent = (props: ComponentProps) => {
+  switch (props.args.variant) {
+    case "group":
+      return <CarbonButtonGroup {...props} />
+    case "grid":
+      return <CarbonButtonGrid {...props} />
+    case "table":
+      return <CarbonActionTable {...props} />
+    case "tuner":
+      return <CarbonColorTuner {...props} />
+    default:
+      return <CarbonButton {...props} />
+  }
+}
+
+export default withStreamlitConnection(CarbonComponent)
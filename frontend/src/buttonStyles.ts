@@ -0,0 +1,66 @@
+import React from "react"
+import { Theme } from "streamlit-component-lib"
+
+// CSS custom properties a Python Theme changes, per mode, e.g.
+// { light: { "--cb-secondary-hover-bg": "#f5f5f5" }, dark: {...} }.
+// Everything else comes from the .carbon-theme defaults in index.css
+export interface ThemeVars {
+  light?: { [name: string]: string }
+  dark?: { [name: string]: string }
+}
+
+/**
+ * Whether to draw the dark palette: the ``mode`` Python asked for, or with
+ * "auto" the base of the theme Streamlit passes in with every render. The
+ * page's theme already follows the OS setting, so no media query listener
+ * is needed here.
+ */
+export const isDarkMode = (mode: string | undefined, theme: Theme | undefined): boolean => {
+  if (mode === "light" || mode === "dark") {
+    return mode === "dark"
+  }
+  return !!theme && theme.base === "dark"
+}
+
+export interface ThemeProps {
+  className: string
+  style?: React.CSSProperties
+}
+
+/**
+ * Props for a component's root element: the theme class for the mode and
+ * the variables the theme overrides. Set once per component, so buttons
+ * only carry class names and hover/active states are plain CSS.
+ */
+export const themeProps = (themeVars: ThemeVars | null | undefined, isDarkMode: boolean): ThemeProps => {
+  const vars = themeVars ? themeVars[isDarkMode ? "dark" : "light"] : undefined
+  return {
+    className: isDarkMode ? "carbon-theme carbon-dark" : "carbon-theme",
+    style: vars as React.CSSProperties | undefined,
+  }
+}
+
+export interface ButtonClassOptions {
+  buttonType: string
+  useContainerWidth?: boolean
+  isIconOnly?: boolean
+  hasIcon?: boolean
+  hasLabel?: boolean
+}
+
+export const buttonClassName = (opts: ButtonClassOptions): string => {
+  const { buttonType, useContainerWidth, isIconOnly, hasIcon, hasLabel } = opts
+  const classes = ["carbon-button", `carbon-button--${buttonType}`]
+
+  // Adjust padding for visual balance: icon + text gets less padding on
+  // the icon side, icon only gets equal padding
+  if (isIconOnly) {
+    classes.push("carbon-button-icon-only")
+  } else if (hasIcon && hasLabel) {
+    classes.push("carbon-button-with-icon")
+  }
+  if (useContainerWidth) {
+    classes.push("carbon-button-fill")
+  }
+  return classes.join(" ")
+}
@@ -0,0 +1,78 @@
+/**
+ * Click events sent to Python.
+ *
+ * Each mounted component gets a random nonce and numbers its clicks from
+ * 1. A remounted iframe starts again at 1 with a new nonce, so Python can
+ * tell every click apart without trusting a counter that resets.
+ */
+export interface ClickEvent {
+  nonce: string
+  seq: number
+}
+
+export class ClickEvents {
+  private readonly nonce: string =
+    Date.now().toString(36) + Math.random().toString(36).slice(2, 10)
+  private seq = 0
+
+  public next(): ClickEvent {
+    this.seq += 1
+    return { nonce: this.nonce, seq: this.seq }
+  }
+}
+
+/** True once Python has acknowledged ``sent`` (or a later click). */
+export const isAcknowledged = (
+  ack: ClickEvent | null | undefined,
+  sent: ClickEvent
+): boolean => !!ack && ack.nonce === sent.nonce && ack.seq >= sent.seq
+
+/**
+ * Client-side throttling for one button.
+ *
+ * With ``throttleMs`` > 0 the first click opens a window of that length.
+ * Without coalescing it is sent at once and further clicks in the window
+ * are dropped; with coalescing the clicks are counted and sent together
+ * when the window closes. Either way the server reruns once per burst.
+ * ``click`` returns false for a click it drops.
+ */
+export class ClickThrottle {
+  private pending = 0
+  private timer: number | null = null
+
+  constructor(private readonly send: (count: number) => void) {}
+
+  public click(throttleMs: number, coalesce: boolean): boolean {
+    if (!throttleMs || throttleMs <= 0) {
+      this.send(1)
+      return true
+    }
+    if (this.timer === null) {
+      if (coalesce) {
+        this.pending = 1
+      } else {
+        this.send(1)
+      }
+      this.timer = window.setTimeout(this.flush, throttleMs)
+      return true
+    }
+    if (coalesce) {
+      this.pending += 1
+      return true
+    }
+    return false
+  }
+
+  /** Send any clicks still waiting in the window. */
+  public flush = (): void => {
+    if (this.timer !== null) {
+      window.clearTimeout(this.timer)
+      this.timer = null
+    }
+    if (this.pending > 0) {
+      const count = this.pending
+      this.pending = 0
+      this.send(count)
+    }
+  }
+}
@@ -1,11 +1,14 @@
 import React from "react"
 import ReactDOM from "react-dom"
-import CarbonButton from "./CarbonButton"
+import CarbonComponent from "./CarbonComponent"
+import { injectIconSprite } from "./icons"
 import "./index.css"
 
+injectIconSprite()
+
 ReactDOM.render(
   <React.StrictMode>
-    <CarbonButton />
+    <CarbonComponent />
   </React.StrictMode>,
   document.getElementById("root")
 )
\ No newline at end of file
@@ -0,0 +1,74 @@
+import { ClickEvent } from "./clickEvents"
+
+/**
+ * Opt-in performance telemetry for one button.
+ *
+ * Enabled from Python with STREAMLIT_CARBON_BUTTON_TELEMETRY. Timings are
+ * in milliseconds from performance.now() and are collected into a batch
+ * that is attached to the next click sent to Python. A button also sends
+ * a batch on its own, as a ``TelemetryReport``, after its first paint and
+ * after each acknowledged click, so timings reach Python even for buttons
+ * that are never (or no longer) clicked. Each report costs one rerun.
+ */
+export interface TelemetryBatch {
+  mountMs?: number
+  firstPaintMs?: number
+  renders: number
+  ackMs: number[]
+}
+
+/** A batch sent without a click; ``report`` tells Python it apart. */
+export interface TelemetryReport {
+  report: ClickEvent
+  telemetry: TelemetryBatch
+}
+
+export class Telemetry {
+  private readonly created = performance.now()
+  private mountMs: number | null = null
+  private firstPaintMs: number | null = null
+  private renders = 0
+  private ackMs: number[] = []
+  private sentAt: number | null = null
+  private reportedMount = false
+
+  public rendered(): void {
+    this.renders += 1
+  }
+
+  /** Record the mount time, and call ``painted`` after the first paint. */
+  public mounted(painted: () => void): void {
+    this.mountMs = performance.now() - this.created
+    // The frame after mount is the first one painted with the button
+    window.requestAnimationFrame(() => {
+      this.firstPaintMs = performance.now() - this.created
+      painted()
+    })
+  }
+
+  public clickSent(): void {
+    this.sentAt = performance.now()
+  }
+
+  public clickAcknowledged(): void {
+    if (this.sentAt !== null) {
+      this.ackMs.push(performance.now() - this.sentAt)
+      this.sentAt = null
+    }
+  }
+
+  /** Everything measured since the last batch, then start a new one. */
+  public takeBatch(): TelemetryBatch {
+    const batch: TelemetryBatch = { renders: this.renders, ackMs: this.ackMs }
+    if (!this.reportedMount && this.mountMs !== null) {
+      batch.mountMs = this.mountMs
+      if (this.firstPaintMs !== null) {
+        batch.firstPaintMs = this.firstPaintMs
+      }
+      this.reportedMount = true
+    }
+    this.renders = 0
+    this.ackMs = []
+    return batch
+  }
+}
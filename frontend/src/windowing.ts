@@ -0,0 +1,55 @@
+import React from "react"
+
+/**
+ * Row windowing shared by the virtualized grid and action table.
+ *
+ * Both lay their rows out absolutely inside a spacer as tall as every row
+ * together, and only mount the rows that intersect the viewport.
+ */
+
+// Rows rendered above and below the viewport so fast scrolling doesn't flash
+const OVERSCAN_ROWS = 4
+
+export interface RowWindow {
+  firstRow: number
+  lastRow: number
+}
+
+/** The rows to mount, ``firstRow`` inclusive to ``lastRow`` exclusive. */
+export const visibleRows = (
+  scrollTop: number,
+  height: number,
+  rowHeight: number,
+  numRows: number
+): RowWindow => ({
+  firstRow: Math.max(0, Math.floor(scrollTop / rowHeight) - OVERSCAN_ROWS),
+  lastRow: Math.min(numRows, Math.ceil((scrollTop + height) / rowHeight) + OVERSCAN_ROWS),
+})
+
+/**
+ * Scroll handling for a windowed component.
+ *
+ * Scroll events are coalesced to one ``update`` per animation frame; call
+ * ``cancel`` when the component unmounts.
+ */
+export class ScrollTracker {
+  private frame: number | null = null
+
+  constructor(private readonly update: (scrollTop: number) => void) {}
+
+  public onScroll = (e: React.UIEvent<HTMLElement>): void => {
+    const scrollTop = e.currentTarget.scrollTop
+    this.cancel()
+    this.frame = window.requestAnimationFrame(() => {
+      this.frame = null
+      this.update(scrollTop)
+    })
+  }
+
+  public cancel(): void {
+    if (this.frame !== null) {
+      window.cancelAnimationFrame(this.frame)
+      this.frame = null
+    }
+  }
+}
@@ -18,10 +18,12 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[
-        "streamlit >= 0.63",
+        "streamlit >= 1.37",
+        "numpy",
     ],
     package_data={
         "briquette": [
+            "carbon_icons.idx",
             "frontend/index.html",
             "frontend/asset-manifest.json",
             "frontend/static/css/*",
@@ -3,8 +3,11 @@ Styled Carbon Button System - Ready for your app!
 Based on the design patterns from test_styled_carbon_buttons.py
 """
 
+import time
+
+import pandas as pd
 import streamlit as st
-from carbon_button import carbon_button, CarbonIcons
+from briquette import action_job, carbon_action_table, carbon_button, carbon_button_group, CarbonIcons
 
 st.set_page_config(page_title="Styled Carbon Button System", page_icon="🎨", layout="wide")
 
@@ -103,7 +106,6 @@ with col5:
 st.header("2️⃣ Icon-Only Toolbar")
 st.markdown("Perfect for compact interfaces")
 
-toolbar_cols = st.columns(12)
 toolbar_buttons = [
     (CarbonIcons.HOME, "home", "Home"),
     (CarbonIcons.ADD, "add", "Add"),
@@ -119,10 +121,16 @@ toolbar_buttons = [
     (CarbonIcons.HELP, "help", "Help"),
 ]
 
-for i, (icon, key, tooltip) in enumerate(toolbar_buttons):
-    with toolbar_cols[i]:
-        if styled_button("", icon, f"tool_{key}", style="minimal"):
-            st.toast(f"{tooltip} clicked!")
+# One component for the whole toolbar instead of one iframe per icon
+tooltips = {key: tooltip for _, key, tooltip in toolbar_buttons}
+clicked = carbon_button_group(
+    [{"icon": icon, "key": key, "help": tooltip} for icon, key, tooltip in toolbar_buttons],
+    key="toolbar",
+    button_type="secondary",
+    use_container_width=True,
+)
+if clicked:
+    st.toast(f"{tooltips[clicked]} clicked!")
 
 # Section 3: Different button styles
 st.header("3️⃣ Button Style Variations")
@@ -168,21 +176,28 @@ with col1:
                     style="minimal", use_container_width=True):
         st.success("Upload dialog opened!")
     
-    if styled_button("Generate Report", CarbonIcons.CHART_BAR, "full2",
-                    style="primary", use_container_width=True):
-        with st.spinner("Generating..."):
-            import time
-            time.sleep(1)
-        st.success("Report generated!")
+    # Runs on a worker thread; the button shows as busy until it's done
+    def generate_report():
+        time.sleep(1)
+        return "Report generated!"
+
+    styled_button("Generate Report", CarbonIcons.CHART_BAR, "full2",
+                  style="primary", use_container_width=True, action=generate_report,
+                  cache={"ttl": 300})
+    report = action_job("full2")
+    if report is not None and report.status == "done":
+        st.success(report.result())
 
 with col2:
     if styled_button("Export Data", CarbonIcons.DOWNLOAD, "full3",
                     style="minimal", use_container_width=True):
         st.info("Exporting...")
     
+    # The confirm prompt is handled in the browser; Python only hears
+    # about the click once it has been confirmed
     if styled_button("Delete All", CarbonIcons.DELETE, "full4",
-                    style="danger", use_container_width=True):
-        st.error("Are you sure?")
+                    style="danger", use_container_width=True, confirm="Delete all?"):
+        st.error("All items deleted.")
 
 # Section 5: Practical Application Example
 st.header("5️⃣ Real Application Example")
@@ -204,32 +219,35 @@ documents = [
     {"name": "Presentation.pptx", "size": "5.2 MB", "date": "Jan 10", "type": "ppt"},
 ]
 
-for i, doc in enumerate(documents):
-    col1, col2, col3, col4, col5 = st.columns([3, 1, 0.5, 0.5, 0.5])
-    
-    with col1:
-        icon_map = {
-            "pdf": "📄", "excel": "📊", "word": "📝", "ppt": "📈"
-        }
-        st.markdown(f"{icon_map.get(doc['type'], '📄')} **{doc['name']}**  \n"
-                   f"<small style='color: #666;'>{doc['size']} • {doc['date']}</small>", 
-                   unsafe_allow_html=True)
-    
-    with col2:
-        # Status
-        st.caption("✅ Synced")
-    
-    with col3:
-        if styled_button("", CarbonIcons.DOWNLOAD, f"dl_{i}", style="minimal"):
-            st.toast(f"Downloading {doc['name']}...")
-    
-    with col4:
-        if styled_button("", CarbonIcons.COPY, f"cp_{i}", style="minimal"):
-            st.toast("Link copied!")
-    
-    with col5:
-        if styled_button("", CarbonIcons.DELETE, f"del_{i}", style="outlined"):
-            st.toast(f"Delete {doc['name']}?", icon="⚠️")
+icon_map = {
+    "pdf": "📄", "excel": "📊", "word": "📝", "ppt": "📈"
+}
+docs_df = pd.DataFrame(documents)
+docs_df["name"] = [f"{icon_map.get(t, '📄')} {n}" for t, n in zip(docs_df["type"], docs_df["name"])]
+docs_df["status"] = "✅ Synced"
+
+# The whole list is one component: rows go over Arrow and the action
+# column is drawn in the browser instead of three iframes per row
+action = carbon_action_table(
+    docs_df,
+    actions=[
+        {"name": "download", "icon": CarbonIcons.DOWNLOAD, "button_type": "secondary"},
+        {"name": "copy", "icon": CarbonIcons.COPY, "button_type": "secondary"},
+        {"name": "delete", "icon": CarbonIcons.DELETE, "button_type": "ghost"},
+    ],
+    columns=["name", "size", "date", "status"],
+    key="documents",
+)
+
+if action:
+    row, name = action
+    doc = documents[row]
+    if name == "download":
+        st.toast(f"Downloading {doc['name']}...")
+    elif name == "copy":
+        st.toast("Link copied!")
+    elif name == "delete":
+        st.toast(f"Delete {doc['name']}?", icon="⚠️")
 
 # Sidebar actions
 with st.sidebar:
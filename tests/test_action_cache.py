@@ -0,0 +1,106 @@
+import functools
+import types
+
+import pytest
+
+from briquette import action_cache
+
+
+def square(x):
+    return x * x
+
+
+def cube(x):
+    return x ** 3
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(action_cache, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(action_cache, "_next_sweep", 0.0)
+    action_cache.clear_cache()
+    yield now
+    action_cache.clear_cache()
+
+
+def test_hits_and_misses_are_counted(clock):
+    digest = action_cache.inputs_digest(square, {"x": 3}, "thread")
+    assert action_cache.get("b", digest) == (False, None)
+    action_cache.put("b", digest, 9, ttl=10, max_entries=4)
+    assert action_cache.get("b", digest) == (True, 9)
+    assert action_cache.get("other", digest) == (False, None)
+    assert action_cache.stats() == {"hits": 1, "misses": 2, "evictions": 0, "size": 1, "buttons": 1}
+
+
+def test_results_expire_after_their_ttl(clock):
+    action_cache.put("b", b"d", "result", ttl=10, max_entries=4)
+    clock[0] += 9.9
+    assert action_cache.get("b", b"d") == (True, "result")
+    clock[0] += 0.2
+    assert action_cache.get("b", b"d") == (False, None)
+    assert action_cache.stats()["size"] == 0
+
+
+def test_sweeps_drop_expired_results_of_other_buttons(clock):
+    action_cache.put("idle", b"d", 1, ttl=5, max_entries=4)
+    action_cache.put("forever", b"d", 2, ttl=None, max_entries=4)
+    clock[0] += action_cache.SWEEP_INTERVAL + 1
+    action_cache.get("forever", b"d")
+    assert action_cache.stats()["buttons"] == 1
+
+
+def test_each_button_keeps_its_most_recently_used_results(clock):
+    for digest in (b"a", b"b", b"c"):
+        action_cache.put("b", digest, digest, ttl=None, max_entries=2)
+    assert action_cache.get("b", b"a")[0] is False
+    action_cache.get("b", b"b")
+    action_cache.put("b", b"d", b"d", ttl=None, max_entries=2)
+    assert action_cache.get("b", b"b")[0] is True
+    assert action_cache.get("b", b"c")[0] is False
+    assert action_cache.stats()["evictions"] == 2
+
+
+def test_the_whole_cache_is_bounded(clock, monkeypatch):
+    monkeypatch.setattr(action_cache, "MAX_ENTRIES", 3)
+    for key in "abcd":
+        action_cache.put(key, b"d", key, ttl=None, max_entries=8)
+    stats = action_cache.stats()
+    assert (stats["size"], stats["buttons"], stats["evictions"]) == (3, 3, 1)
+    assert action_cache.get("a", b"d")[0] is False
+
+
+def test_digest_depends_on_action_inputs_and_executor():
+    digest = action_cache.inputs_digest(square, {"x": 2, "y": 1}, "thread")
+    assert digest == action_cache.inputs_digest(square, {"y": 1, "x": 2}, "thread")
+    assert digest != action_cache.inputs_digest(square, {"x": 3, "y": 1}, "thread")
+    assert digest != action_cache.inputs_digest(cube, {"x": 2, "y": 1}, "thread")
+    assert digest != action_cache.inputs_digest(square, {"x": 2, "y": 1}, "process")
+    assert action_cache.inputs_digest(functools.partial(square, 2), {}, "thread") != action_cache.inputs_digest(
+        functools.partial(square, 3), {}, "thread"
+    )
+
+
+def test_unpicklable_inputs_raise():
+    with pytest.raises(ValueError, match="picklable"):
+        action_cache.inputs_digest(square, {"x": lambda: 1}, "thread")
+
+
+@pytest.mark.parametrize(
+    "cache, expected",
+    [
+        (None, None),
+        (False, None),
+        (True, (action_cache.DEFAULT_TTL, action_cache.DEFAULT_MAX_ENTRIES)),
+        ({"ttl": None}, (None, action_cache.DEFAULT_MAX_ENTRIES)),
+        ({"ttl": 5, "max_entries": 2}, (5, 2)),
+    ],
+)
+def test_options(cache, expected):
+    assert action_cache.options(cache) == expected
+
+
+@pytest.mark.parametrize("cache", [{"size": 3}, {"ttl": 0}, {"max_entries": 0}, "yes"])
+def test_invalid_options_raise(cache):
+    with pytest.raises(ValueError):
+        action_cache.options(cache)
@@ -0,0 +1,75 @@
+import pickle
+from concurrent.futures import Future
+
+import pytest
+import streamlit.runtime
+
+from briquette import action_cache, actions
+
+
+class _Runtime:
+    active = {"alive"}
+
+    @classmethod
+    def exists(cls):
+        return True
+
+    @classmethod
+    def instance(cls):
+        return cls()
+
+    def is_active_session(self, session_id):
+        return session_id in self.active
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    monkeypatch.setattr(streamlit.runtime, "Runtime", _Runtime)
+    monkeypatch.setattr(actions, "_process_jobs", {})
+    jobs = {session: Future() for session in ("alive", "gone")}
+    for session, future in jobs.items():
+        actions._process_jobs[future] = session
+    return jobs
+
+
+def test_finishing_job_cancels_queued_jobs_of_closed_sessions(queued):
+    finished = Future()
+    actions._process_jobs[finished] = "alive"
+    finished.set_result(b"")
+    actions._forget_process_job(finished)
+    assert queued["gone"].cancelled()
+    assert not queued["alive"].cancelled()
+    assert finished not in actions._process_jobs
+
+
+def test_running_jobs_are_not_cancelled(queued):
+    queued["gone"].set_running_or_notify_cancel()
+    actions._cancel_orphaned_jobs()
+    assert not queued["gone"].cancelled()
+
+
+def _answer(value):
+    return value
+
+
+def _pickled_future(action, inputs):
+    # Stands in for the process pool: the result comes back pickled
+    future = Future()
+    future.set_result(pickle.dumps(action(**inputs)))
+    return future
+
+
+def test_process_job_does_not_reuse_a_thread_jobs_cached_result(monkeypatch):
+    monkeypatch.setattr(actions, "_submit_process", _pickled_future)
+    action_cache.clear_cache()
+    cache = action_cache.options(True)
+    try:
+        thread_job = actions.SessionJobs().submit("report", _answer, {"value": 42}, "thread", cache)
+        assert thread_job.result() == 42
+        process_job = actions.SessionJobs().submit("report", _answer, {"value": 42}, "process", cache)
+        assert process_job.result() == 42
+        assert not process_job.cached
+        again = actions.SessionJobs().submit("report", _answer, {"value": 42}, "process", cache)
+        assert again.cached and again.result() == 42
+    finally:
+        action_cache.clear_cache()
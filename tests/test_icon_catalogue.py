@@ -0,0 +1,59 @@
+import pytest
+
+from briquette.icon_catalogue import IconCatalogue, build_catalogue, build_catalogue_from_directory, icon_name
+
+ICONS = {
+    "ADD": '<svg viewBox="0 0 32 32"><path d="M17 15V8h-2v7H8v2h7v7h2v-7h7v-2z"/></svg>',
+    "CHART_LINE": '<svg viewBox="0 0 32 32"><path d="M4 28h24"/></svg>',
+}
+
+
+@pytest.mark.parametrize(
+    "filename, name",
+    [
+        ("add.svg", "ADD"),
+        ("chart--bar.svg", "CHART_BAR"),
+        ("watson-health/3d-cursor.svg", "WATSON_HEALTH_3D_CURSOR"),
+    ],
+)
+def test_icon_name(filename, name):
+    assert icon_name(filename) == name
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "icons.idx"
+    build_catalogue(ICONS, str(path))
+    catalogue = IconCatalogue(str(path))
+    assert len(catalogue) == 2
+    assert catalogue.names() == ["ADD", "CHART_LINE"]
+    assert "CHART_LINE" in catalogue and "MISSING" not in catalogue
+    assert catalogue.get("CHART_LINE") == ICONS["CHART_LINE"]
+    assert catalogue.get("CHART_LINE") is catalogue.get("CHART_LINE")
+    assert catalogue.get("MISSING") is None
+
+
+def test_files_that_are_not_an_index_raise(tmp_path):
+    path = tmp_path / "icons.idx"
+    path.write_bytes(b"not an index at all")
+    with pytest.raises(ValueError):
+        len(IconCatalogue(str(path)))
+
+
+def test_directories_are_indexed_recursively(tmp_path):
+    (tmp_path / "watson-health").mkdir()
+    (tmp_path / "add.svg").write_text('<svg>\n  <path d="M0 0"/>\n</svg>\n')
+    (tmp_path / "watson-health" / "3d-cursor.svg").write_text("<svg/>")
+    (tmp_path / "notes.txt").write_text("not an icon")
+    path = tmp_path / "icons.idx"
+    assert build_catalogue_from_directory(str(tmp_path), str(path)) == 2
+    catalogue = IconCatalogue(str(path))
+    assert catalogue.names() == ["ADD", "WATSON_HEALTH_3D_CURSOR"]
+    assert catalogue.get("ADD") == '<svg><path d="M0 0"/></svg>'
+
+
+def test_clashing_names_raise(tmp_path):
+    (tmp_path / "chart").mkdir()
+    (tmp_path / "chart" / "bar.svg").write_text("<svg/>")
+    (tmp_path / "chart--bar.svg").write_text("<svg/>")
+    with pytest.raises(ValueError, match="CHART_BAR"):
+        build_catalogue_from_directory(str(tmp_path), str(tmp_path / "icons.idx"))
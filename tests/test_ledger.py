@@ -0,0 +1,54 @@
+from briquette.ledger import ClickLedger
+
+
+def click(nonce, seq, **extra):
+    return {"nonce": nonce, "seq": seq, **extra}
+
+
+def test_each_click_is_consumed_once():
+    ledger = ClickLedger()
+    assert ledger.consume("save", None) is False
+    assert ledger.consume("save", click("a", 1)) is True
+    assert ledger.consume("save", click("a", 1)) is False
+    assert ledger.consume("save", click("a", 2)) is True
+
+
+def test_a_remounted_component_is_not_mistaken_for_an_old_click():
+    ledger = ClickLedger()
+    assert ledger.consume("save", click("a", 1)) is True
+    assert ledger.consume("save", click("b", 1)) is True
+
+
+def test_values_that_are_not_click_events_are_ignored():
+    ledger = ClickLedger()
+    for value in ("clicked", True, {"seq": 1}, [1], 0):
+        assert ledger.consume("save", value) is False
+
+
+def test_running_counts_from_older_bundles_are_clicks():
+    ledger = ClickLedger()
+    assert ledger.consume("save", 1) is True
+    assert ledger.consume("save", 1) is False
+    assert ledger.consume("save", 2) is True
+
+
+def test_idle_keys_are_evicted():
+    ledger = ClickLedger(idle_runs=2)
+    ledger.start_page_run(1)
+    ledger.consume("kept", None)
+    ledger.consume("dropped", click("a", 1))
+    ledger.defer("dropped", True)
+    for page_run in (2, 3):
+        ledger.start_page_run(page_run)
+        ledger.touch("kept")
+    ledger.start_page_run(4)
+    assert "kept" in ledger and "dropped" not in ledger
+    assert ledger.take_deferred("dropped") is None
+    assert ledger.stats() == {"size": 1, "evicted": 1, "idle_runs": 2}
+
+
+def test_deferred_clicks_are_taken_once():
+    ledger = ClickLedger()
+    ledger.defer("save", 3)
+    assert ledger.take_deferred("save") == 3
+    assert ledger.take_deferred("save") is None
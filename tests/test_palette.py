@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from briquette.palette import audit, contrast_ratio, relative_luminance
+from briquette.theme import Theme
+
+
+def _ratio(first, second):
+    return float(contrast_ratio(relative_luminance(first), relative_luminance(second)))
+
+
+def test_relative_luminance_of_black_white_and_unparsed_colors():
+    luminance = relative_luminance(np.array([0x000000, 0xFFFFFF, -1]))
+    assert luminance[0] == 0.0
+    assert luminance[1] == pytest.approx(1.0)
+    assert np.isnan(luminance[2])
+
+
+@pytest.mark.parametrize(
+    "first, second, expected",
+    [(0x000000, 0xFFFFFF, 21.0), (0xFFFFFF, 0x000000, 21.0), (0x777777, 0xFFFFFF, 4.48), (0x767676, 0xFFFFFF, 4.54)],
+)
+def test_contrast_ratios_match_wcag(first, second, expected):
+    assert _ratio(first, second) == pytest.approx(expected, abs=0.01)
+
+
+def test_failures_report_text_below_the_minimum():
+    result = audit({
+        "grey": {"rest_bg": "#ffffff", "rest_text": "#777777"},
+        "black": {"rest_bg": "#fff", "rest_text": "#000"},
+    })
+    assert result.names == ["grey", "black"]
+    assert result.passed().tolist() == [False, True]
+    [(name, state, part, ratio)] = result.failures()
+    assert (name, state, part) == ("grey", "rest", "text")
+    assert ratio == pytest.approx(4.48, abs=0.01)
+    assert result.worst()[1] == pytest.approx(21.0)
+
+
+def test_borders_only_fail_when_included():
+    palette = {"page_bg": "#ffffff", "rest_bg": "#0f62fe", "rest_text": "#ffffff", "rest_border": "#dddddd"}
+    result = audit(palette)
+    assert result.failures() == []
+    [(_, state, part, ratio)] = result.failures(include_borders=True)
+    assert (state, part) == ("rest", "border")
+    assert ratio < 3.0
+    assert not result.passed(include_borders=True)[0]
+
+
+def test_disabled_state_is_skipped_unless_included():
+    result = audit({"disabled_bg": "#ffffff", "disabled_text": "#eeeeee"})
+    assert result.failures() == []
+    assert len(result.failures(include_disabled=True)) == 1
+
+
+def test_unparsed_or_missing_colors_never_fail():
+    result = audit([{"rest_bg": "transparent", "rest_text": "#000000"}, {"rest_bg": "#ffffff"}])
+    assert np.isnan(result.ratios).all()
+    assert result.failures() == []
+
+
+def test_themes_are_audited_per_mode_and_button_type():
+    result = audit({"brand": Theme()})
+    assert "brand/light/primary" in result.names
+    assert "brand/dark/ghost" in result.names
+    assert len(result) == 8
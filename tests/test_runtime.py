@@ -0,0 +1,75 @@
+import pytest
+
+from briquette import _runtime
+from briquette._runtime import RunState
+
+
+@pytest.fixture
+def run(monkeypatch):
+    monkeypatch.setattr(_runtime, "IFRAME_BUDGET", 6)
+    state = RunState()
+    state._start_run(object(), fragment_run=False)
+    return state
+
+
+def test_buttons_past_the_budget_go_native(run):
+    modes = [run.render_mode(f"b{i}", "auto") for i in range(8)]
+    assert modes == ["component"] * 6 + ["native"] * 2
+    assert (run.iframes, run.native, run.downgraded) == (6, 2, 2)
+
+
+def test_fragment_reruns_do_not_recount_buttons(run):
+    for fragment_run in (False, True, True):
+        if fragment_run:
+            run._start_run(object(), fragment_run=True)
+        for key in "abcd":
+            run.render_mode(key, "auto")
+        run.record_iframe("group")
+    assert (run.iframes, run.native) == (5, 0)
+    assert run.render_mode("new", "auto") == "component"
+
+
+def test_page_run_resets_the_totals(run):
+    for key in "abcd":
+        run.render_mode(key, "auto")
+    run._start_run(object(), fragment_run=False)
+    assert (run.iframes, run.native) == (0, 0)
+
+
+
+class _FinishedJob:
+    done = True
+
+
+class _RunningJob:
+    done = False
+
+
+def test_idle_keys_drop_their_finished_jobs_and_telemetry(monkeypatch):
+    monkeypatch.setattr(_runtime, "IFRAME_BUDGET", 50)
+    run = RunState()
+    run.ledger.idle_runs = 1
+    run._start_run(object(), fragment_run=False)
+    for key in ("kept", "finished", "running"):
+        run.ledger.touch(key)
+        run.metrics.record(key, {"renders": 1})
+    run.jobs._jobs.update(kept=_FinishedJob(), finished=_FinishedJob(), running=_RunningJob())
+    for _ in range(2):
+        run._start_run(object(), fragment_run=False)
+        run.ledger.touch("kept")
+    assert run.jobs.get("kept") is not None and run.jobs.get("finished") is None
+    # A running job still counts against the session's limit
+    assert run.jobs.get("running") is not None
+    assert "kept" in run.metrics and "finished" not in run.metrics
+
+
+def _three_save_buttons(run):
+    return [run.auto_key("carbon_button", "Save") for _ in range(3)]
+
+
+def test_auto_key_is_stable_and_ordinal_within_a_run(run):
+    keys = _three_save_buttons(run)
+    assert keys[1] == f"{keys[0]}_1" and keys[2] == f"{keys[0]}_2"
+    run._start_run(object(), fragment_run=False)
+    assert _three_save_buttons(run) == keys
+    assert run.auto_key("carbon_button", "Open") not in keys
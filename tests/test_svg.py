@@ -0,0 +1,52 @@
+import pytest
+
+from briquette import CarbonIcons
+from briquette.svg import normalize_svg
+
+
+@pytest.mark.parametrize("tag", ["foreignObject", "foreignobject", "FOREIGNOBJECT"])
+def test_foreign_object_is_dropped_in_any_case(tag):
+    svg = f'<svg><{tag}><IFRAME srcdoc="&lt;script&gt;alert(1)&lt;/script&gt;"/></{tag}></svg>'
+    normalized = normalize_svg(svg)
+    assert "iframe" not in normalized.lower()
+    assert "script" not in normalized.lower()
+    assert normalized == '<svg fill="currentColor"/>'
+
+
+def test_animated_link_is_dropped():
+    svg = '<svg><a><set attributeName="href" to="javascript:alert(1)"/><path d="M0 0"/></a></svg>'
+    normalized = normalize_svg(svg)
+    assert "javascript" not in normalized
+    assert "<a" not in normalized
+    assert "set" not in normalized
+
+
+@pytest.mark.parametrize("tag", ["animate", "Animate", "animateTransform", "ANIMATEMOTION", "SET", "A", "Script"])
+def test_unlisted_elements_are_dropped_in_any_case(tag):
+    normalized = normalize_svg(f'<svg><{tag} href="javascript:alert(1)"/><path d="M0 0"/></svg>')
+    assert normalized == '<svg fill="currentColor"><path d="M0 0"/></svg>'
+
+
+def test_unlisted_attributes_are_dropped_in_any_case():
+    normalized = normalize_svg(
+        '<svg><path ONCLICK="alert(1)" Style="x" D="M 0 0" FILL="#000" Stroke="#111"/></svg>'
+    )
+    assert normalized == '<svg fill="currentColor"><path d="M0 0" stroke="currentColor"/></svg>'
+
+
+def test_external_references_are_dropped():
+    normalized = normalize_svg(
+        '<svg xmlns:xlink="http://www.w3.org/1999/xlink">'
+        '<use xlink:href="https://example.com/icons.svg#a"/><use href="#a"/>'
+        '<rect mask="url(https://example.com/m)" clip-path="url(#c)"/></svg>'
+    )
+    assert "example.com" not in normalized
+    assert '<use href="#a"/>' in normalized
+    assert 'clip-path="url(#c)"' in normalized
+
+
+def test_carbon_icon_keeps_its_shapes():
+    normalized = normalize_svg(CarbonIcons.HELP)
+    assert normalized.count("<path") == 2
+    assert "<circle" in normalized
+    assert 'viewBox="0 0 32 32"' in normalized
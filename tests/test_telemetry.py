@@ -0,0 +1,33 @@
+from briquette.telemetry import SessionMetrics, report_id
+
+
+def _report(seq, nonce="n1", **batch):
+    return {"report": {"nonce": nonce, "seq": seq}, "telemetry": dict({"renders": 1, "ackMs": []}, **batch)}
+
+
+def test_report_id_ignores_clicks():
+    assert report_id({"nonce": "n1", "seq": 1, "count": 1}) is None
+    assert report_id(None) is None
+    assert report_id(_report(2)) == ("n1", 2)
+
+
+def test_a_report_is_recorded_once_across_reruns():
+    metrics = SessionMetrics()
+    first_paint = _report(1, mountMs=3.0, firstPaintMs=9.0)
+    for _ in range(3):
+        metrics.record_report("save", first_paint)
+    dump = metrics.dump()["save"]
+    assert dump["batches"] == 1
+    assert dump["first_paint_ms"]["mean"] == 9.0
+
+    metrics.record_report("save", _report(2, ackMs=[40.0]))
+    dump = metrics.dump()["save"]
+    assert dump["batches"] == 2
+    assert dump["click_ack_ms"]["count"] == 1
+
+
+def test_a_remounted_button_reports_again():
+    metrics = SessionMetrics()
+    metrics.record_report("save", _report(1))
+    metrics.record_report("save", _report(1, nonce="n2"))
+    assert metrics.get("save").batches == 2
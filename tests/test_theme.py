@@ -0,0 +1,57 @@
+import pytest
+
+from briquette.theme import DEFAULT_THEME, Theme, check_mode, resolve_theme, theme_payload, variable_name
+
+
+@pytest.mark.parametrize(
+    "light",
+    [
+        {"tertiary": {"rest_bg": "#000000"}},
+        {"primary": {"focus_bg": "#000000"}},
+        {"primary": {"rest_bg": "url(javascript:alert(1))"}},
+        {"primary": {"rest_bg": "#12345g"}},
+    ],
+)
+def test_invalid_overrides_raise(light):
+    with pytest.raises(ValueError):
+        Theme(light=light)
+
+
+def test_dark_mode_defaults_to_the_light_overrides():
+    theme = Theme(light={"primary": {"rest_bg": "#123456"}})
+    assert theme.palette("light", "primary")["rest_bg"] == "#123456"
+    assert theme.palette("dark", "primary")["rest_bg"] == "#123456"
+    assert theme.overrides["dark"] == {variable_name("primary", "rest_bg"): "#123456"}
+
+
+def test_equal_themes_hash_equal():
+    first = Theme(light={"danger": {"hover_bg": "#ff0000"}})
+    second = Theme(light={"danger": {"hover_bg": "#ff0000"}}, dark={"danger": {"hover_bg": "#ff0000"}})
+    other = Theme(light={"danger": {"hover_bg": "#00ff00"}})
+    assert first == second and hash(first) == hash(second)
+    assert first != other and first.hash != other.hash
+    assert len({first, second, other}) == 2
+
+
+def test_default_colors_compile_to_no_payload():
+    assert Theme() == DEFAULT_THEME
+    assert theme_payload(Theme()) is None
+    assert theme_payload(Theme(light={"ghost": {"rest_text": "red"}})) == {
+        "light": {"--cb-ghost-rest-text": "red"},
+        "dark": {"--cb-ghost-rest-text": "red"},
+    }
+
+
+def test_colors_dicts_are_compiled_once():
+    colors = {"rest_bg": "#101010", "rest_text": "#fafafa"}
+    assert Theme.from_colors(dict(colors), "primary") is Theme.from_colors(dict(colors), "primary")
+    assert resolve_theme(None, colors, "primary").palette("light", "primary")["rest_bg"] == "#101010"
+    assert resolve_theme(None, None) is DEFAULT_THEME
+    with pytest.raises(ValueError):
+        resolve_theme(DEFAULT_THEME, colors)
+
+
+def test_check_mode():
+    assert check_mode("dark") == "dark"
+    with pytest.raises(ValueError):
+        check_mode("sepia")